@@ -0,0 +1,135 @@
+# ppt-service/artifact_cache.py
+from collections import OrderedDict
+from atomic_files import write_atomic
+import hashlib
+import json
+import os
+import threading
+
+# Size budget for cached decks; 0 disables the cache entirely
+ARTIFACT_CACHE_MAX_BYTES = int(os.getenv("ARTIFACT_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+
+def source_fingerprint(paths):
+    """
+    Short digest of the renderer sources/templates, so any template change invalidates old entries.
+    """
+    h = hashlib.sha256()
+    for path in sorted(paths):
+        h.update(os.path.basename(path).encode())
+        if os.path.exists(path):
+            with open(path, 'rb') as f: h.update(f.read())
+    return h.hexdigest()[:12]
+
+def normalize_payload(payload):
+    """
+    Canonical JSON for a deck payload: string payloads are decoded, keys sorted, whitespace dropped.
+    """
+    if isinstance(payload, str):
+        try: payload = json.loads(payload)
+        except: return payload.strip()
+    return json.dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+
+def cache_key(endpoint, team_name, college_name, payload, version):
+    h = hashlib.sha256()
+    for part in (endpoint, team_name, college_name, normalize_payload(payload), version):
+        h.update(str(part).encode('utf-8')); h.update(b'\0')
+    return h.hexdigest()
+
+class ArtifactCache:
+    """
+    Content-addressed store of rendered decks: <root>/<key><ext>, evicted least-recently-used by total size.
+    """
+
+    def __init__(self, root, max_bytes=ARTIFACT_CACHE_MAX_BYTES, ext=".pptx"):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ext = ext
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> size, oldest first
+        self._bytes = 0
+        self._lock = threading.Lock()
+        if not self.enabled: return
+        if not os.path.exists(root): os.makedirs(root)
+        found = []
+        for entry in os.scandir(root):
+            if entry.is_file() and entry.name.endswith(ext):
+                st = entry.stat()
+                found.append((st.st_mtime, entry.name[:-len(ext)], st.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._bytes += size
+        self._evict()
+
+    @property
+    def enabled(self):
+        return self.max_bytes > 0
+
+    def _path(self, key):
+        return os.path.join(self.root, f"{key}{self.ext}")
+
+    def get(self, key):
+        """
+        Returns the cached artifact path for key (marking it recently used), or None.
+        """
+        if not self.enabled: return None
+        with self._lock:
+            if key not in self._entries or not os.path.exists(self._path(key)):
+                self._drop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        path = self._path(key)
+        try: os.utime(path)
+        except OSError: pass
+        return path
+
+    def restore(self, key, dest):
+        """
+        Copies a cached artifact to dest. Returns dest on a hit, None on a miss.
+        """
+        path = self.get(key)
+        if not path: return None
+        return write_atomic(dest, path)
+
+    def read(self, key):
+        """
+        Returns the cached artifact bytes for key, or None.
+        """
+        path = self.get(key)
+        if not path: return None
+        with open(path, 'rb') as f: return f.read()
+
+    def put(self, key, src):
+        """
+        Stores an artifact given as a file path or as raw bytes.
+        """
+        if not self.enabled: return
+        if isinstance(src, bytes):
+            size = len(src)
+        elif os.path.exists(src):
+            size = os.path.getsize(src)
+        else:
+            return
+        if size > self.max_bytes: return
+        write_atomic(self._path(key), src)
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = size
+            self._bytes += size
+            self._evict()
+
+    def stats(self):
+        return {"entries": len(self._entries), "bytes": self._bytes, "max_bytes": self.max_bytes, "hits": self.hits, "misses": self.misses}
+
+    def _drop(self, key):
+        size = self._entries.pop(key, None)
+        if size is not None: self._bytes -= size
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._bytes -= size
+            try: os.remove(self._path(key))
+            except OSError: pass
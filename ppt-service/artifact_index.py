@@ -0,0 +1,153 @@
+# ppt-service/artifact_index.py
+import os
+import sqlite3
+import threading
+import time
+
+# Optional persistence for metadata that cannot be recovered from the files themselves (team, downloads)
+ARTIFACT_INDEX_DB = os.getenv("ARTIFACT_INDEX_DB")
+
+def is_plain_name(filename):
+    """
+    A bare file name: no directory part, separator or parent reference that could step outside a vault.
+    """
+    return bool(filename) and os.path.basename(filename) == filename and not any(s in filename for s in ("/", "\\", "..", "\0"))
+
+def is_artifact_name(filename):
+    """
+    Only finished decks and certificates count; temp files of in-progress writes (see atomic_files) never do.
+    """
+    return filename.endswith('.pptx')
+
+class ArtifactIndex:
+    """
+    In-memory registry of every artifact in the vaults, kept current as files are written.
+    Gives O(1) counts, exact and case-folded lookups, and per-file metadata without touching the directory.
+    """
+
+    def __init__(self, vaults, db_path=ARTIFACT_INDEX_DB):
+        self.vaults = vaults  # kind -> directory
+        self._entries = {kind: {} for kind in vaults}  # kind -> filename -> meta
+        self._folded = {kind: {} for kind in vaults}   # kind -> casefolded filename -> filename
+        self._bytes = {kind: 0 for kind in vaults}
+        self._lock = threading.Lock()
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("""CREATE TABLE IF NOT EXISTS artifacts (
+                kind TEXT, filename TEXT, size INTEGER, created REAL, team TEXT,
+                last_access REAL, synced INTEGER DEFAULT 0, PRIMARY KEY (kind, filename))""")
+            self._db.commit()
+        self.scan()
+
+    def scan(self):
+        """
+        One directory pass per vault at startup, merged with any persisted metadata.
+        """
+        saved = {}
+        if self._db:
+            with self._lock:
+                for row in self._db.execute("SELECT kind, filename, team, last_access, synced FROM artifacts"):
+                    saved[(row[0], row[1])] = {"team": row[2], "last_access": row[3], "synced": bool(row[4])}
+        for kind, root in self.vaults.items():
+            if not os.path.isdir(root): continue
+            for entry in os.scandir(root):
+                if entry.is_file() and is_artifact_name(entry.name):
+                    st = entry.stat()
+                    extra = saved.pop((kind, entry.name), {})
+                    self._put(kind, entry.name, st.st_size, st.st_mtime, persist=False, **extra)
+        if self._db and saved:
+            # Rows for files that vanished while the service was down
+            with self._lock:
+                self._db.executemany("DELETE FROM artifacts WHERE kind = ? AND filename = ?", list(saved.keys()))
+                self._db.commit()
+        if self._db:
+            with self._lock:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [self._row(kind, meta) for kind in self._entries for meta in self._entries[kind].values()])
+                self._db.commit()
+
+    def record(self, kind, path, team=None):
+        """
+        Registers (or refreshes) a file that was just written into a vault. Returns None for anything that is
+        not an artifact name.
+        """
+        filename = os.path.basename(path)
+        if not is_artifact_name(filename): return None
+        st = os.stat(path)
+        previous = self.get(kind, filename) or {}
+        return self._put(kind, filename, st.st_size, time.time(),
+                         team=team or previous.get("team"), last_access=previous.get("last_access"), synced=False)
+
+    def remove(self, kind, filename):
+        with self._lock:
+            meta = self._entries[kind].pop(filename, None)
+            if meta is None: return None
+            if self._folded[kind].get(filename.casefold()) == filename:
+                self._folded[kind].pop(filename.casefold())
+            self._bytes[kind] -= meta["size"]
+            if self._db:
+                self._db.execute("DELETE FROM artifacts WHERE kind = ? AND filename = ?", (kind, filename))
+                self._db.commit()
+        return meta
+
+    def lookup(self, kind, filename):
+        """
+        Resolves a requested name to the stored filename: exact match first, then case-insensitive.
+        """
+        with self._lock:
+            if filename in self._entries[kind]: return filename
+            return self._folded[kind].get(filename.casefold())
+
+    def get(self, kind, filename):
+        with self._lock:
+            meta = self._entries[kind].get(filename)
+            return dict(meta) if meta else None
+
+    def path(self, kind, filename):
+        return os.path.join(self.vaults[kind], filename)
+
+    def count(self, kind):
+        return len(self._entries[kind])
+
+    def total_bytes(self, kind=None):
+        return sum(self._bytes.values()) if kind is None else self._bytes[kind]
+
+    def entries(self, kind):
+        with self._lock:
+            return [dict(meta) for meta in self._entries[kind].values()]
+
+    def mark(self, kind, filename, **fields):
+        """
+        Updates metadata fields (e.g. last_access, synced) on an indexed artifact.
+        """
+        with self._lock:
+            meta = self._entries[kind].get(filename)
+            if meta is None: return None
+            meta.update(fields)
+            if self._db:
+                self._db.execute("INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?, ?, ?, ?)", self._row(kind, meta))
+                self._db.commit()
+            return dict(meta)
+
+    def stats(self):
+        return {kind: {"count": len(self._entries[kind]), "bytes": self._bytes[kind]} for kind in self._entries}
+
+    def _put(self, kind, filename, size, created, team=None, last_access=None, synced=False, persist=True):
+        meta = {"filename": filename, "size": size, "created": created, "team": team,
+                "last_access": last_access, "synced": bool(synced)}
+        with self._lock:
+            old = self._entries[kind].get(filename)
+            if old: self._bytes[kind] -= old["size"]
+            self._entries[kind][filename] = meta
+            self._folded[kind][filename.casefold()] = filename
+            self._bytes[kind] += size
+            if self._db and persist:
+                self._db.execute("INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?, ?, ?, ?)", self._row(kind, meta))
+                self._db.commit()
+        return dict(meta)
+
+    @staticmethod
+    def _row(kind, meta):
+        return (kind, meta["filename"], meta["size"], meta["created"], meta["team"], meta["last_access"], int(meta["synced"]))
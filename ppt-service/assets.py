@@ -0,0 +1,77 @@
+# ppt-service/assets.py
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.parts.image import Image, ImagePart
+from pptx.shapes.shapetree import SlideShapes
+import glob
+import hashlib
+import os
+import weakref
+
+# Static branding assets, resolved against the service directory (never the cwd)
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSET_PATTERNS = ("institution_logo.png", "hackathon_logo.png", "viksit_bharat*.png")
+
+class Asset:
+    """
+    A preloaded image: bytes, content hash and pixel size are computed once at startup.
+    """
+
+    def __init__(self, name, path):
+        self.name = name
+        self.path = path
+        with open(path, 'rb') as f: self.data = f.read()
+        self.sha1 = hashlib.sha1(self.data).hexdigest()
+        self.image = Image.from_blob(self.data, name)
+        self.size = self.image.size
+
+    def manifest(self):
+        return {"sha1": self.sha1, "bytes": len(self.data), "px": list(self.size)}
+
+ASSETS = {}
+
+# In-memory insertion relies on python-pptx shape-tree internals; without them we use the public file path
+_FAST_PATH = all(hasattr(SlideShapes, attr) for attr in ("_add_pic_from_image_part", "_recalculate_extents", "_shape_factory"))
+
+# Per-package image parts already created for an asset (sha1 -> ImagePart), so repeats skip hashing and decoding
+_package_parts = weakref.WeakKeyDictionary()
+
+def load_assets():
+    ASSETS.clear()
+    for pattern in ASSET_PATTERNS:
+        for path in sorted(glob.glob(os.path.join(ASSET_DIR, pattern))):
+            name = os.path.basename(path)
+            try:
+                ASSETS[name] = Asset(name, path)
+            except Exception as e:
+                print(f"[ASSETS] Failed to load {name}: {e}")
+    return ASSETS
+
+def get_asset(name):
+    return ASSETS.get(name)
+
+def _image_part(package, asset):
+    parts = _package_parts.setdefault(package, {})
+    part = parts.get(asset.sha1)
+    if part is None:
+        part = ImagePart.new(package, asset.image)
+        parts[asset.sha1] = part
+    return part
+
+def add_asset_picture(slide, name, left, top, width=None, height=None):
+    """
+    Inserts a registered asset from memory. Returns the picture, or None when the asset is not installed.
+    """
+    asset = get_asset(name)
+    if asset is None: return None
+
+    shapes = slide.shapes
+    if not _FAST_PATH:
+        return shapes.add_picture(asset.path, left, top, width, height)
+
+    image_part = _image_part(slide.part.package, asset)
+    rId = slide.part.relate_to(image_part, RT.IMAGE)
+    pic = shapes._add_pic_from_image_part(image_part, rId, left, top, width, height)
+    shapes._recalculate_extents()
+    return shapes._shape_factory(pic)
+
+load_assets()
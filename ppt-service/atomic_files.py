@@ -0,0 +1,32 @@
+# ppt-service/atomic_files.py
+import os
+import shutil
+import uuid
+
+def temp_path(dest):
+    """
+    Sibling temp name unique to one write (process and call), so concurrent writers of a path never share it.
+    Vault scans only pick up .pptx files, so a write in progress is never indexed.
+    """
+    return f"{dest}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
+
+def discard(tmp):
+    try: os.remove(tmp)
+    except OSError: pass
+
+def write_atomic(dest, src):
+    """
+    Publishes src (bytes or a file path) at dest through a temp file and a rename: readers see the old
+    file or the new one, never a partial write, and the last concurrent writer wins whole.
+    """
+    tmp = temp_path(dest)
+    try:
+        if isinstance(src, (bytes, bytearray)):
+            with open(tmp, 'wb') as f: f.write(src)
+        else:
+            shutil.copyfile(src, tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        discard(tmp)
+        raise
+    return dest
@@ -0,0 +1,48 @@
+# ppt-service/base_presentation.py
+from io import BytesIO
+from pptx import Presentation
+from pptx.util import Inches
+import copy
+import threading
+
+# Slide sizes per base; None keeps python-pptx's default 4:3 (10in x 7.5in)
+BASE_SIZES = {
+    "deck": None,
+    "certificate": (Inches(13.33), Inches(7.5)),
+}
+
+# kind -> pristine Presentation (never drawn on), or its saved bytes when it cannot be deep-copied
+_BASES = {}
+_LOCK = threading.Lock()
+
+def _build(kind):
+    prs = Presentation()
+    size = BASE_SIZES[kind]
+    if size: prs.slide_width, prs.slide_height = size
+    # Only fully independent copies are usable; otherwise fall back to re-opening saved bytes.
+    # The base itself is inspected through raw XML so none of its lazy proxies get cached (and copied).
+    try:
+        probe = copy.deepcopy(prs)
+        probe.slides.add_slide(probe.slide_layouts[6])
+        if len(probe._element.xpath("p:sldIdLst/p:sldId")) == 1 and not prs._element.xpath("p:sldIdLst/p:sldId"):
+            return prs
+    except Exception as e:
+        print(f"[TEMPLATE] Deep copy unavailable for '{kind}' base ({e}); using saved bytes")
+    out = BytesIO(); prs.save(out)
+    return out.getvalue()
+
+def new_presentation(kind="deck"):
+    """
+    A fresh, independent presentation for one render. The default template is parsed (and resized)
+    once per process; every call returns a copy of that pristine base.
+    """
+    base = _BASES.get(kind)
+    if base is None:
+        with _LOCK:
+            base = _BASES.get(kind)
+            if base is None: base = _BASES[kind] = _build(kind)
+    if isinstance(base, bytes): return Presentation(BytesIO(base))
+    return copy.deepcopy(base)
+
+def warm_bases():
+    for kind in BASE_SIZES: new_presentation(kind)
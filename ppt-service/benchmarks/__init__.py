@@ -0,0 +1 @@
+# ppt-service/benchmarks/__init__.py
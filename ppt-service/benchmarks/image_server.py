@@ -0,0 +1,63 @@
+# ppt-service/benchmarks/image_server.py
+"""
+Local HTTP server for evidence images, so draw_prototype is measured without the network.
+"""
+from io import BytesIO
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+from PIL import Image
+
+def _jpeg(width, height, seed):
+    img = Image.new("RGB", (width, height), (40 + seed * 50 % 200, 120, 160))
+    # A gradient band keeps the JPEG from compressing to nothing
+    band = Image.linear_gradient("L").resize((width, height // 4)).convert("RGB")
+    img.paste(band, (0, height // 3))
+    out = BytesIO()
+    img.save(out, "JPEG", quality=92)
+    return out.getvalue()
+
+class ImageServer:
+    """
+    Serves /img/<n>.jpg (large camera-sized JPEGs) with ETags, like a typical upload host.
+    """
+
+    def __init__(self, port=0, width=4000, height=3000, count=3):
+        self.images = {f"/img/{i}.jpg": _jpeg(width, height, i) for i in range(count)}
+        self.hits = 0
+        images, server = self.images, self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args): pass
+
+            def do_GET(self):
+                server.hits += 1
+                body = images.get(self.path.split("?")[0])
+                if body is None:
+                    self.send_response(404); self.end_headers(); return
+                etag = f'"{len(body)}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304); self.end_headers(); return
+                self.send_response(200)
+                self.send_header("Content-Type", "image/jpeg")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.port = self._httpd.server_address[1]
+
+    def urls(self, tag=""):
+        """
+        Image URLs; a distinct tag produces URLs no fetch cache has seen yet.
+        """
+        return [f"http://127.0.0.1:{self.port}{path}?r={tag}" for path in self.images]
+
+    def __enter__(self):
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -0,0 +1,359 @@
+# ppt-service/benchmarks/load.py
+"""
+Load generator for the HTTP service: a weighted mix of deck, certificate, download and health requests
+at a fixed concurrency, either back to back (closed loop) or at a Poisson arrival rate (open loop).
+
+    python -m benchmarks.load                                     # start the service from this tree, 60 s at concurrency 8
+    python -m benchmarks.load -c 16 --rate 3 -d 120 --images      # ~3 arrivals/s, evidence images from a local server
+    python -m benchmarks.load --env RENDER_WORKERS=2 -o two.json  # size a container: settings passed to the service
+    python -m benchmarks.load --url http://127.0.0.1:8000 --mix expert=1,health=1
+
+Run from the ppt-service directory. Without --url the service is started with uvicorn on a free port (as in
+the container), the run begins once /ready answers, and the artifacts and cache entries it rendered are
+removed afterwards (--keep leaves them). Every request carries a distinct team or participant unless
+--distinct limits them, so renders are cold by default. With --rate, latency counts from each request's
+scheduled arrival: an overloaded service shows up as growing latency, not as a politely slower load.
+Reports throughput, p50/p95/p99 latency and error rate per endpoint, plus the peak memory of the service
+and its render workers when it was started here.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+import requests
+
+from benchmarks.image_server import ImageServer
+from benchmarks.payloads import basic_payload, certificate_args, expert_payload
+from benchmarks.run import RESULTS_DIR, SERVICE_DIR, revision
+
+OPERATIONS = ("expert", "artifact", "certificate", "outputs", "health")
+# Default traffic shape near a submission deadline: mostly expert decks and certificates
+DEFAULT_MIX = "expert=4,artifact=1,certificate=3,outputs=2,health=1"
+# Payload size distribution for deck requests
+_SIZES = (("typical", 8), ("minimal", 1), ("worst", 1))
+_TIMEOUT = (5, 300)  # connect, read: the backend itself waits up to 180 s for a deck
+
+def _deck_body(team_name, payload):
+    # Same shape as the backend's admin regeneration call: the payload travels twice
+    return {"team_name": team_name, "college_name": "Load Test Institute", "content": payload, "project_data": payload}
+
+class LoadRun:
+    """
+    Builds and sends one request per call. Deck file names returned by the service feed the /outputs downloads.
+    """
+
+    def __init__(self, base_url, mix, distinct=0, images=None, seed=0):
+        self.base_url = base_url.rstrip("/")
+        self.mix = mix
+        self.distinct = distinct
+        self.images = images
+        self.rng = random.Random(seed)
+        self.decks = []
+        self._count = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def next_request(self, op=None):
+        """
+        (op, method, path, json body) for the next request, of kind op or drawn from the mix. Drawn under a
+        lock, so a seeded run issues the same sequence whatever the thread timing.
+        """
+        with self._lock:
+            op = op or self.rng.choices(list(self.mix), list(self.mix.values()))[0]
+            n = self._count = self._count + 1
+            team = n % self.distinct if self.distinct else n
+            download = self.rng.choice(self.decks) if self.decks else None
+        # Derived from the team, so a repeated team sends the identical payload
+        size = random.Random(team).choices([s for s, _ in _SIZES], [w for _, w in _SIZES])[0]
+        if op == "expert":
+            data = expert_payload(size, self.images.urls(f"team{team}") if self.images else ())
+            return op, "POST", "/generate-expert-pitch", _deck_body(f"Load Team {team}", data)
+        if op == "artifact":
+            return op, "POST", "/generate-artifact", _deck_body(f"Load Team {team}", basic_payload(size))
+        if op == "certificate":
+            args = certificate_args("worst" if size == "worst" else "typical")
+            return op, "POST", "/generate-certificate", {**args, "name": f"{args['name']} {team}",
+                                                          "team_name": f"Load Team {team}", "submission_date": "2026-03-01"}
+        if op == "outputs":
+            return op, "GET", f"/outputs/{download or 'missing.pptx'}", None
+        return op, "GET", "/health", None
+
+    def send(self, request, scheduled=None):
+        """
+        Sends one request and returns (op, seconds, error or None). Latency runs from scheduled when given.
+        """
+        op, method, path, body = request
+        start = scheduled or time.perf_counter()
+        try:
+            r = self._session().request(method, self.base_url + path, json=body, timeout=_TIMEOUT)
+            error = None if r.status_code < 400 else f"HTTP {r.status_code}"
+            if error is None and method == "POST":
+                result = r.json()
+                if not result.get("success"):
+                    error = f"failed: {str(result.get('error'))[:80]}"
+                elif op in ("expert", "artifact"):
+                    self.decks.append(result["file_url"])
+        except (requests.RequestException, ValueError) as e:
+            error = type(e).__name__
+        return op, time.perf_counter() - start, error
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        op, _, weight = part.partition("=")
+        if op.strip() not in OPERATIONS: raise ValueError(f"Unknown endpoint '{op.strip()}' (one of {', '.join(OPERATIONS)})")
+        mix[op.strip()] = float(weight or 1)
+    return mix
+
+def closed_loop(run, concurrency, deadline, limit):
+    """
+    concurrency workers, each sending its next request as soon as the previous one returns.
+    """
+    results, lock, issued = [], threading.Lock(), 0
+    def worker():
+        nonlocal issued
+        while time.perf_counter() < deadline:
+            with lock:
+                if limit and issued >= limit: return
+                issued += 1
+            results.append(run.send(run.next_request()))
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    return results
+
+def open_loop(run, concurrency, rate, deadline, limit):
+    """
+    Poisson arrivals at rate per second, at most concurrency in flight; late requests queue and their wait counts.
+    """
+    futures = []
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        arrival = time.perf_counter()
+        while arrival < deadline and not (limit and len(futures) >= limit):
+            delay = arrival - time.perf_counter()
+            if delay > 0: time.sleep(delay)
+            futures.append(pool.submit(run.send, run.next_request(), arrival))
+            arrival += run.rng.expovariate(rate)
+    return [f.result() for f in futures]
+
+def _percentile(sorted_values, q):
+    if len(sorted_values) == 1: return sorted_values[0]
+    return statistics.quantiles(sorted_values, n=100, method="inclusive")[q - 1]
+
+def summarize(results, elapsed):
+    """
+    Per operation and overall: count, errors, error rate, throughput and latency percentiles (seconds).
+    """
+    groups = {}
+    for op, seconds, error in results:
+        groups.setdefault(op, []).append((seconds, error))
+    groups["all"] = [(seconds, error) for _, seconds, error in results]
+    summary = {}
+    for op, rows in groups.items():
+        if not rows: continue
+        latencies = sorted(seconds for seconds, _ in rows)
+        errors = [error for _, error in rows if error]
+        summary[op] = {
+            "requests": len(rows),
+            "errors": len(errors),
+            "error_rate": len(errors) / len(rows),
+            "throughput_rps": len(rows) / elapsed,
+            "latency_s": {"p50": _percentile(latencies, 50), "p95": _percentile(latencies, 95),
+                          "p99": _percentile(latencies, 99), "max": latencies[-1]},
+            "error_samples": sorted(set(errors))[:5],
+        }
+    return summary
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def _tree_rss(pid):
+    """
+    Resident memory of pid and its descendants (render workers, LibreOffice) in bytes; Linux /proc only.
+    """
+    total, pending = 0, [pid]
+    while pending:
+        p = pending.pop()
+        try:
+            with open(f"/proc/{p}/status") as f:
+                total += next((int(line.split()[1]) * 1024 for line in f if line.startswith("VmRSS:")), 0)
+            for task in os.listdir(f"/proc/{p}/task"):
+                with open(f"/proc/{p}/task/{task}/children") as f:
+                    pending.extend(int(c) for c in f.read().split())
+        except (OSError, ValueError):
+            continue
+    return total
+
+# Directories the service writes artifacts into, relative to the service tree
+_OUTPUT_DIRS = ("ppt_outputs", "certs_outputs", "artifact_cache")
+
+def _listing(path):
+    try: return set(os.listdir(path))
+    except OSError: return set()
+
+class LocalService:
+    """
+    The service started from this tree on a free port, with its output in log; peak_rss tracks the memory
+    of the whole process tree while it runs.
+    """
+
+    def __init__(self, env, ready_timeout=180):
+        self.port = _free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.scratch = tempfile.mkdtemp(prefix="ppt-load-")
+        self.log = os.path.join(self.scratch, "service.log")
+        self.env = {**os.environ,
+                    "IMAGE_CACHE_DIR": os.path.join(self.scratch, "images"),
+                    "NORMALIZED_CACHE_DIR": os.path.join(self.scratch, "images", "normalized"), **env}
+        self.ready_timeout = ready_timeout
+        self.peak_rss = 0
+        self._stop = threading.Event()
+        self._before = {d: _listing(os.path.join(SERVICE_DIR, d)) for d in _OUTPUT_DIRS}
+
+    def __enter__(self):
+        with open(self.log, "wb") as log:
+            self.proc = subprocess.Popen([sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(self.port)],
+                                         cwd=SERVICE_DIR, env=self.env, stdout=log, stderr=subprocess.STDOUT)
+        deadline = time.monotonic() + self.ready_timeout
+        while True:
+            if self.proc.poll() is not None:
+                raise RuntimeError(f"Service exited with {self.proc.returncode} during start-up, see {self.log}")
+            try:
+                if requests.get(self.url + "/ready", timeout=2).status_code == 200: break
+            except requests.RequestException:
+                pass
+            if time.monotonic() > deadline:
+                self.__exit__()
+                raise RuntimeError(f"Service not ready after {self.ready_timeout:.0f} s, see {self.log}")
+            time.sleep(0.5)
+        threading.Thread(target=self._sample, daemon=True).start()
+        return self
+
+    def _sample(self):
+        while not self._stop.wait(0.5):
+            self.peak_rss = max(self.peak_rss, _tree_rss(self.proc.pid))
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self.proc.terminate()
+        try:
+            self.proc.wait(30)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+
+    def remove_outputs(self):
+        """
+        Deletes the vault files and cache entries that appeared while the service ran (call once it is stopped).
+        """
+        removed = 0
+        for d, before in self._before.items():
+            for name in _listing(os.path.join(SERVICE_DIR, d)) - before:
+                try:
+                    os.remove(os.path.join(SERVICE_DIR, d, name))
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+def report(summary):
+    print(f"\n{'endpoint':<14}{'requests':>10}{'errors':>9}{'req/s':>9}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    for op, s in summary.items():
+        lat = s["latency_s"]
+        print(f"{op:<14}{s['requests']:>10}{s['error_rate']:>9.1%}{s['throughput_rps']:>9.2f}"
+              + "".join(f"{lat[q] * 1000:>8.0f}ms" for q in ("p50", "p95", "p99", "max")))
+        for sample in s["error_samples"]:
+            print(f"{'':<14}! {sample}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTTP load generator for the synthesis service")
+    parser.add_argument("--url", help="target a running service instead of starting one from this tree")
+    parser.add_argument("-c", "--concurrency", type=int, default=8, help="requests in flight at most")
+    parser.add_argument("--rate", type=float, default=0, help="mean arrivals per second (Poisson); 0 sends back to back")
+    parser.add_argument("-d", "--duration", type=float, default=60, help="seconds to generate load for")
+    parser.add_argument("-n", "--requests", type=int, default=0, help="stop after this many requests (0: no limit)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"endpoint weights (default: {DEFAULT_MIX})")
+    parser.add_argument("--distinct", type=int, default=0, help="cycle through this many teams, so repeats hit the cache (0: all distinct)")
+    parser.add_argument("--images", action="store_true", help="give expert decks evidence images from a local image server")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE", help="setting for the started service (repeatable)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep", action="store_true", help="leave rendered artifacts in the vaults")
+    parser.add_argument("-o", "--output", help="results file (default: benchmarks/results/load-<git rev>.json)")
+    args = parser.parse_args(argv)
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    results = {
+        "revision": revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "settings": {"url": args.url, "concurrency": args.concurrency, "rate": args.rate, "duration_s": args.duration,
+                     "requests": args.requests, "mix": mix, "distinct": args.distinct, "images": args.images,
+                     "env": dict(e.split("=", 1) for e in args.env)},
+    }
+    service, run = None, None
+    with ExitStack() as stack:
+        images = stack.enter_context(ImageServer()) if args.images else None
+        if not args.url:
+            service = LocalService(results["settings"]["env"])
+            print(f"[LOAD] Starting service from {SERVICE_DIR} (log: {service.log})")
+            stack.enter_context(service)
+        run = LoadRun(args.url or service.url, mix, args.distinct, images, args.seed)
+        # Seeds the download pool (and warms the connection) outside the measured window
+        _, _, error = run.send(run.next_request("artifact"))
+        if error: raise RuntimeError(f"Seed request failed: {error}")
+
+        mode = f"{args.rate:g} req/s arrivals" if args.rate else "closed loop"
+        print(f"[LOAD] {mode}, concurrency {args.concurrency}, {args.duration:g} s, mix {args.mix}")
+        start = time.perf_counter()
+        deadline = start + args.duration
+        if args.rate:
+            outcomes = open_loop(run, args.concurrency, args.rate, deadline, args.requests)
+        else:
+            outcomes = closed_loop(run, args.concurrency, deadline, args.requests)
+        elapsed = time.perf_counter() - start
+
+        results["elapsed_s"] = elapsed
+        results["endpoints"] = summarize(outcomes, elapsed)
+        try:
+            results["service_health"] = requests.get(run.base_url + "/health", timeout=10).json()
+        except (requests.RequestException, ValueError):
+            results["service_health"] = None
+    if service:
+        results["service_peak_rss_bytes"] = service.peak_rss
+        if not args.keep: print(f"[LOAD] Removed {service.remove_outputs()} artifacts rendered by the run")
+
+    report(results["endpoints"])
+    if results.get("service_peak_rss_bytes"):
+        print(f"\n[LOAD] Service peak RSS {results['service_peak_rss_bytes'] / 1048576:.0f} MiB (API process + render workers)")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"load-{results['revision']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f: json.dump(results, f, indent=2)
+    print(f"[LOAD] Results saved to {output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# ppt-service/benchmarks/payloads.py
+"""
+Synthetic, deterministic inputs for the synthesis engines: minimal, typical and worst-case.
+"""
+import random
+
+_WORDS = ("water sensor farmer yield crop soil irrigation network data alert cost village cooperative "
+          "basically actually really very platform mobile low power scale market subsidy drought").split()
+
+def words(n, seed=0):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(_WORDS) for _ in range(n))
+
+def sentences(n, per=12, seed=0):
+    """
+    Text with mixed '. ', ';' and newline separators, the shapes polish_content has to split on.
+    """
+    seps = (". ", "; ", "\n")
+    return "".join(words(per, seed + i) + seps[i % 3] for i in range(n))
+
+def expert_payload(size="typical", image_urls=()):
+    """
+    Expert-deck payload. "minimal" carries only the project name, "typical" a realistic form
+    submission, "worst" every list at or beyond its drawing limit plus evidence images.
+    """
+    if size == "minimal":
+        return {"projectName": "Minimal"}
+
+    worst = size == "worst"
+    text = (lambda n, seed: words(n * 3, seed)) if worst else words
+    data = {
+        "projectName": "Aqua Sense" if not worst else words(12, 1),
+        "leaderName": "Asha", "memberNames": "Ravi, Meena, Arjun, Divya",
+        "s2_domain": text(6, 2), "s2_context": text(40, 3), "s2_rootReason": text(20, 4),
+        "s3_coreProblem": text(50, 5), "s3_affected": text(20, 6), "s3_whyItMatters": text(30, 7),
+        "s4_painPoints": [{"point": text(12, 10 + i), "freq": ["Rare", "Occasional", "Frequent"][i % 3],
+                           "impact": ["Low", "Medium", "High"][i % 3]} for i in range(8 if worst else 4)],
+        "s5_primaryUsers": text(35, 20), "s5_secondaryUsers": text(35, 21),
+        "s6_customerName": "Raju", "s6_customerAge": "45", "s6_customerLocation": "Coimbatore",
+        "s6_pains": text(35, 22), "s6_goals": text(35, 23), "s6_howWeHelp": text(35, 24),
+        "s7_alternatives": text(35, 25), "s7_limitations": text(35, 26), "s7_gainCreators": text(35, 27), "s7_painKillers": text(35, 28),
+        "s8_solution": text(50, 29), "s8_coreTech": text(15, 30),
+        "s9_oneline": text(15, 31), "s9_flowSteps": [text(12, 40 + i) for i in range(6 if worst else 4)],
+        "s11_lifts": [text(6, 50 + i) for i in range(6 if worst else 2)],
+        "s11_pulls": [text(6, 60 + i) for i in range(6 if worst else 2)],
+        "s11_outcomes": [text(6, 70 + i) for i in range(6 if worst else 2)],
+        "s12_competitors": [{"name": f"Rival {i}", "strength": text(4, 80 + i)} for i in range(6 if worst else 2)],
+        "s12_ourVenture": {"name": "Us", "strength": text(4, 90)},
+        "s13_tam": "1B", "s13_sam": "100M", "s13_som": "10M", "s13_marketLogic": text(30, 91),
+        "s14_primaryStream": text(40, 92), "s14_secondaryStream": text(40, 93),
+        "s14_pricingStrategy": text(40, 94), "s14_revenueLogic": text(40, 95),
+        "s15_allocations": [{"category": f"Line item {i}", "amount": str(1000 * (i + 1))} for i in range(40 if worst else 5)],
+        "s16_socialEconomic": text(50, 96), "s16_vision": text(40, 97),
+    }
+    for i, k in enumerate(("Problem", "Solution", "USP", "Unfair", "Segments", "Metrics", "Channels", "Costs", "Revenue")):
+        data[f"s10_lean{k}"] = text(25, 100 + i)
+    for i, url in enumerate(image_urls[:3]):
+        data[f"s8_5_img{i + 1}"] = url
+    return data
+
+def basic_payload(size="typical"):
+    """
+    Legacy (polish_content + create_pptx) payload in the slide-by-slide format.
+    """
+    if size == "minimal":
+        return {"slides": [{"title": "Intro", "content": "Short"}]}
+    count, per = (20, 30) if size == "worst" else (6, 6)
+    return {"slides": [{"title": f"Slide {i + 1}", "content": sentences(per, seed=i)} for i in range(count)]}
+
+def certificate_args(size="typical"):
+    name = {"minimal": "A", "typical": "Asha Raman", "worst": words(8, 5).title()}[size]
+    college = {"minimal": "", "typical": "Jansons Institute of Technology", "worst": words(20, 6).title()}[size]
+    return {"name": name, "college": college, "year": "III", "dept": "CSE", "role": "Participant"}
@@ -0,0 +1,179 @@
+# ppt-service/benchmarks/run.py
+"""
+Benchmarks for the synthesis engines.
+
+    python -m benchmarks.run                         # run everything, save benchmarks/results/<git rev>.json
+    python -m benchmarks.run -k expert -n 10         # only cases whose name contains "expert"
+    python -m benchmarks.run --compare benchmarks/results/<old rev>.json
+
+Run from the ppt-service directory. Each case reports wall time (min/median/mean over -n runs after one
+warm-up), median seconds per drawer/stage, peak Python heap (tracemalloc, measured in a separate run so
+it does not distort the timings) and the size of the serialized .pptx.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from io import BytesIO
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVICE_DIR)
+
+# Keep the fetch cache out of the service tree; evidence URLs are made unique per run so every fetch is cold
+_SCRATCH = tempfile.mkdtemp(prefix="ppt-bench-")
+os.environ.setdefault("IMAGE_CACHE_DIR", os.path.join(_SCRATCH, "images"))
+
+import image_normalize
+from benchmarks.image_server import ImageServer
+from benchmarks.payloads import basic_payload, certificate_args, expert_payload, words
+from certificate_engine import create_certificate
+from expert_synthesis import clean_text, create_expert_deck
+from generator import create_pptx
+from synthesis_logic import polish_content
+
+RESULTS_DIR = os.path.join(SERVICE_DIR, "benchmarks", "results")
+
+def _cold_images():
+    # A fresh normalized-image cache so every run pays for resampling, as a first render would
+    image_normalize.NORMALIZED_CACHE_DIR = tempfile.mkdtemp(dir=_SCRATCH)
+
+def build_cases(server):
+    """
+    name -> fn(timings, run) returning the rendered bytes (or None for the text micro-benchmarks).
+    """
+    def expert(size, images=False):
+        def run(timings, n):
+            if images: _cold_images()
+            data = expert_payload(size, server.urls(f"{time.time_ns()}-{n}") if images else ())
+            out = BytesIO()
+            create_expert_deck("Bench Team", "Bench College", data, out=out, timings=timings)
+            return out.getvalue()
+        return run
+
+    def basic(size):
+        payload = basic_payload(size)
+        def run(timings, n):
+            start = time.perf_counter()
+            processed = polish_content(payload)
+            timings["polish"] = time.perf_counter() - start
+            out = BytesIO()
+            create_pptx("Bench Team", "Bench College", processed, out=out, timings=timings)
+            return out.getvalue()
+        return run
+
+    def certificate(size, use_template=False):
+        args = certificate_args(size)
+        def run(timings, n):
+            out = BytesIO()
+            create_certificate(**args, out_path=out, use_template=use_template, timings=timings)
+            return out.getvalue()
+        return run
+
+    def text(fn, arg, loops):
+        def run(timings, n):
+            for _ in range(loops): fn(arg)
+            return None
+        return run
+
+    long_text = words(600, seed=7)
+    return {
+        "expert-minimal": expert("minimal"),
+        "expert-typical": expert("typical"),
+        "expert-worst": expert("worst", images=True),
+        "basic-minimal": basic("minimal"),
+        "basic-typical": basic("typical"),
+        "basic-worst": basic("worst"),
+        "certificate-typical": certificate("typical"),
+        "certificate-worst": certificate("worst"),
+        "certificate-template": certificate("typical", use_template=True),
+        "polish_content-x1000": text(polish_content, basic_payload("worst"), 1000),
+        "clean_text-x10000": text(lambda t: clean_text(t, 50), long_text, 10000),
+    }
+
+def measure(fn, iterations):
+    fn({}, "warmup")
+    walls, stages, size = [], {}, None
+    for n in range(iterations):
+        timings = {}
+        start = time.perf_counter()
+        data = fn(timings, n)
+        walls.append(time.perf_counter() - start)
+        for stage, seconds in timings.items():
+            stages.setdefault(stage, []).append(seconds)
+        size = len(data) if data is not None else None
+
+    tracemalloc.start()
+    fn({}, "memory")
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "wall_s": {"min": min(walls), "median": statistics.median(walls), "mean": statistics.mean(walls)},
+        "stages_s": {stage: statistics.median(values) for stage, values in stages.items()},
+        "peak_mem_bytes": peak,
+        "output_bytes": size,
+        "iterations": iterations,
+    }
+
+def revision():
+    try:
+        rev = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=SERVICE_DIR, stderr=subprocess.DEVNULL).decode().strip()
+        dirty = subprocess.call(["git", "diff", "--quiet", "HEAD", "--", "."], cwd=SERVICE_DIR, stderr=subprocess.DEVNULL) != 0
+        return rev + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unversioned"
+
+def compare(base, current):
+    print(f"\n{'case':<24}{'base median':>14}{'now median':>14}{'change':>10}{'peak mem':>12}{'size':>10}")
+    for name, now in current["cases"].items():
+        old = base["cases"].get(name)
+        if not old:
+            print(f"{name:<24}{'-':>14}{now['wall_s']['median'] * 1000:>12.1f}ms{'new':>10}")
+            continue
+        b, c = old["wall_s"]["median"], now["wall_s"]["median"]
+        mem = (now["peak_mem_bytes"] - old["peak_mem_bytes"]) / max(old["peak_mem_bytes"], 1)
+        size = ((now["output_bytes"] or 0) - (old["output_bytes"] or 0)) / max(old["output_bytes"] or 1, 1)
+        print(f"{name:<24}{b * 1000:>12.1f}ms{c * 1000:>12.1f}ms{(c - b) / b:>+10.1%}{mem:>+12.1%}{size:>+10.1%}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Synthesis engine benchmarks")
+    parser.add_argument("-n", "--iterations", type=int, default=5)
+    parser.add_argument("-k", "--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("-o", "--output", help="results file (default: benchmarks/results/<git rev>.json)")
+    parser.add_argument("--compare", help="previous results file to compare against")
+    args = parser.parse_args(argv)
+
+    results = {
+        "revision": revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cases": {},
+    }
+    with ImageServer() as server:
+        for name, fn in build_cases(server).items():
+            if args.filter not in name: continue
+            r = results["cases"][name] = measure(fn, args.iterations)
+            size = f"{r['output_bytes'] / 1024:.0f} KiB" if r["output_bytes"] else "-"
+            print(f"[BENCH] {name:<24} median {r['wall_s']['median'] * 1000:8.1f} ms  "
+                  f"peak {r['peak_mem_bytes'] / 1048576:6.1f} MiB  out {size}")
+            slowest = sorted(r["stages_s"].items(), key=lambda kv: -kv[1])[:3]
+            if slowest:
+                print("        slowest stages: " + ", ".join(f"{s} {t * 1000:.1f} ms" for s, t in slowest))
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{results['revision']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f: json.dump(results, f, indent=2)
+    print(f"[BENCH] Results saved to {output}")
+
+    if args.compare:
+        with open(args.compare) as f: compare(json.load(f), results)
+
+if __name__ == "__main__":
+    main()
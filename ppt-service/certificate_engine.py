@@ -1,10 +1,18 @@
 # ppt-service/certificate_engine.py
-from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+from pptx.text.text import _Paragraph
+from assets import add_asset_picture
+from base_presentation import new_presentation
+from package_writer import save_presentation
+from timings import StageTimer
+import copy
 import os
+import threading
 
 # Institutional Premium Theme
 PRIMARY_COLOR = RGBColor(13, 148, 136) # Teal-600
@@ -12,12 +20,24 @@ TEXT_MAIN = RGBColor(30, 41, 59)       # Slate-800
 ACCENT_GREY = RGBColor(241, 245, 249)  # Slate-100
 WHITE = RGBColor(255, 255, 255)
 
-def create_certificate(name, college, year, dept, role, event_name="BHARAT BRILLIANT HACKATHON", submission_date="[Submission Date]", out_path=None):
-    prs = Presentation()
+# Skeleton cache: one pre-drawn certificate per event name (see render_from_template)
+_TEMPLATE_CACHE = {}
+_TEMPLATE_LOCK = threading.Lock()
+
+def _draw_certificate(name, college, year, dept, event_name, submission_date):
+    """
+    Draws the full certificate onto a fresh 16:9 presentation.
+    Returns the presentation and the paragraphs that carry participant data.
+    """
     # Use 16:9 Aspect Ratio
-    prs.slide_width = Inches(13.33)
-    prs.slide_height = Inches(7.5)
-    
+    prs = new_presentation("certificate")
+    shapes = _draw_certificate_slide(prs, name, college, year, dept, event_name, submission_date)
+    return prs, {field: shape.text_frame.paragraphs[0] for field, shape in shapes.items()}
+
+def _draw_certificate_slide(prs, name, college, year, dept, event_name, submission_date):
+    """
+    Appends one certificate slide to prs. Returns the text boxes that carry participant data.
+    """
     slide = prs.slides.add_slide(prs.slide_layouts[6])
     
     # 1. Background Decoration
@@ -33,9 +53,7 @@ def create_certificate(name, college, year, dept, role, event_name="BHARAT BRILL
     border2.fill.background(); border2.line.color.rgb = PRIMARY_COLOR; border2.line.width = Pt(1)
  
     # 3. Logo
-    logo_path = os.path.join(os.path.dirname(__file__), "hackathon_logo.png")
-    if os.path.exists(logo_path):
-        slide.shapes.add_picture(logo_path, (prs.slide_width - Inches(1.5))/2, Inches(0.8), width=Inches(1.5))
+    add_asset_picture(slide, "hackathon_logo.png", (prs.slide_width - Inches(1.5))/2, Inches(0.8), width=Inches(1.5))
 
     # 4. Content Content
     tx_cert = slide.shapes.add_textbox(0, Inches(2.6), prs.slide_width, Inches(0.8))
@@ -54,14 +72,14 @@ def create_certificate(name, college, year, dept, role, event_name="BHARAT BRILL
     tx_details = slide.shapes.add_textbox(0, Inches(4.8), prs.slide_width, Inches(0.8))
     tf_d = tx_details.text_frame; tf_d.word_wrap = True
     p_d = tf_d.paragraphs[0]; p_d.alignment = PP_ALIGN.CENTER
-    p_d.text = f"of {year} Year, Department of {dept}, {college}"
+    p_d.text = _details_line(college, year, dept)
     p_d.font.size = Pt(16); p_d.font.color.rgb = TEXT_MAIN
 
     # Institutional Margin Compliance: Compact text block centered with padding
     tx_event = slide.shapes.add_textbox(Inches(2.16), Inches(5.3), prs.slide_width - Inches(4.32), Inches(1.2))
     tf_e = tx_event.text_frame; tf_e.word_wrap = True
     p_e = tf_e.paragraphs[0]; p_e.alignment = PP_ALIGN.CENTER
-    p_e.text = f"Has successfully completed the Innovation Mission by participating in the {event_name.upper()}, an official institutional hackathon, with the final submission made on {submission_date}."
+    p_e.text = _event_line(event_name, submission_date)
     p_e.font.size = Pt(12.5); p_e.font.color.rgb = RGBColor(71, 85, 105)
 
     # 5. Bottom Signatures
@@ -71,14 +89,99 @@ def create_certificate(name, college, year, dept, role, event_name="BHARAT BRILL
     # Adjusted width and position to accommodate longer HOD title while keeping right-side alignment visual
     tx_sig2 = slide.shapes.add_textbox(prs.slide_width - Inches(6.0), Inches(6.4), Inches(4.5), Inches(0.4))
     p_s2 = tx_sig2.text_frame.paragraphs[0]; p_s2.alignment = PP_ALIGN.RIGHT; p_s2.text = "HOD COMPUTER SCIENCE AND ENGINEERING"; p_s2.font.size = Pt(10); p_s2.font.bold = True; p_s2.font.color.rgb = TEXT_MAIN
+
+    return {"name": tx_name, "details": tx_details, "event": tx_event}
+
+def _details_line(college, year, dept):
+    return f"of {year} Year, Department of {dept}, {college}"
+
+def _event_line(event_name, submission_date):
+    return f"Has successfully completed the Innovation Mission by participating in the {event_name.upper()}, an official institutional hackathon, with the final submission made on {submission_date}."
+
+def _certificate_template(event_name):
+    """
+    Returns the cached skeleton for an event, drawing it on first use.
+    The skeleton is a complete certificate whose participant paragraphs get rewritten per render.
+    """
+    with _TEMPLATE_LOCK:
+        tpl = _TEMPLATE_CACHE.get(event_name)
+        if tpl is None:
+            prs, fields = _draw_certificate("Participant", "Institution", "N/A", "N/A", event_name, "[Submission Date]")
+            tpl = {"prs": prs, "fields": fields, "lock": threading.Lock()}
+            _TEMPLATE_CACHE[event_name] = tpl
+    return tpl
+
+def _fill_fields(fields, name, college, year, dept, event_name, submission_date):
+    # Replacing the runs keeps each paragraph's formatting, so the result matches a fresh draw
+    fields["name"].text = name.upper()
+    fields["details"].text = _details_line(college, year, dept)
+    fields["event"].text = _event_line(event_name, submission_date)
+
+def _clone_certificate_slide(prs, source, field_ids):
+    """
+    Appends a copy of an already drawn certificate slide, pointing at the same image parts, and returns
+    the copy's participant paragraphs (located by the shape ids in field_ids).
+    """
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    rids = {rId: slide.part.relate_to(rel.target_part, RT.IMAGE)
+            for rId, rel in source.part.rels.items() if rel.reltype == RT.IMAGE}
+    clone = copy.deepcopy(source.shapes._spTree)
+    for blip in clone.xpath(".//a:blip[@r:embed]"):
+        blip.set(qn("r:embed"), rids[blip.get(qn("r:embed"))])
+    # Move the copied children into the slide's own tree so its cached shape proxies stay valid
+    spTree = slide.shapes._spTree
+    spTree[:] = list(clone)
+    return {field: _Paragraph(spTree.xpath(f"p:sp[p:nvSpPr/p:cNvPr/@id='{shape_id}']/p:txBody/a:p")[0], None)
+            for field, shape_id in field_ids.items()}
+
+def render_from_template(name, college, year, dept, event_name, submission_date, out, timings=None):
+    """
+    TEMPLATE MODE: Fills the cached skeleton with participant data and serializes it.
+    Produces the same slide as a full redraw without rebuilding shapes or re-reading the logo.
+    """
+    timer = StageTimer(timings)
+    tpl = _certificate_template(event_name)
+    with tpl["lock"]:
+        _fill_fields(tpl["fields"], name, college, year, dept, event_name, submission_date)
+        timer.lap("draw")
+        save_presentation(tpl["prs"], out)
+        timer.lap("save")
+    return out
+
+def create_certificate(name, college, year, dept, role, event_name="BHARAT BRILLIANT HACKATHON", submission_date="[Submission Date]", out_path=None, use_template=False, timings=None):
+    if not out_path:
+        if not os.path.exists('certs_outputs'): os.makedirs('certs_outputs')
+        safe_name = name.lower().replace(' ', '_')
+        out_path = f"certs_outputs/certificate_{safe_name}.pptx"
+
+    if use_template:
+        return render_from_template(name, college, year, dept, event_name, submission_date, out_path, timings)
+
+    timer = StageTimer(timings)
+    prs, _ = _draw_certificate(name, college, year, dept, event_name, submission_date)
+    timer.lap("draw")
     
     # Final Secure Output
-    if out_path:
-        prs.save(out_path)
-        return out_path
-    
-    if not os.path.exists('certs_outputs'): os.makedirs('certs_outputs')
-    safe_name = name.lower().replace(' ', '_')
-    fallback_path = f"certs_outputs/certificate_{safe_name}.pptx"
-    prs.save(fallback_path)
-    return fallback_path
+    save_presentation(prs, out_path)
+    timer.lap("save")
+    return out_path
+
+def create_certificate_bundle(participants, out_path, timings=None):
+    """
+    BUNDLE MODE: one presentation with a slide per participant, sharing a single master, theme and logo,
+    serialized once. participants are dicts with name, college, year, dept, event_name, submission_date.
+    The first slide is drawn; every other one is a copy of it with the participant paragraphs rewritten.
+    """
+    if not participants: raise ValueError("No participants to bundle.")
+    timer = StageTimer(timings)
+    prs = new_presentation("certificate")
+    fields = [(p['name'], p['college'], p['year'], p['dept'], p['event_name'], p['submission_date']) for p in participants]
+    shapes = _draw_certificate_slide(prs, *fields[0])
+    source = prs.slides[0]
+    field_ids = {field: shape.shape_id for field, shape in shapes.items()}
+    for values in fields[1:]:
+        _fill_fields(_clone_certificate_slide(prs, source, field_ids), *values)
+    timer.lap("draw")
+    save_presentation(prs, out_path)
+    timer.lap("save")
+    return out_path
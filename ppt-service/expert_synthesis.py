@@ -1,10 +1,17 @@
 from io import BytesIO
-import requests
-from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
-from pptx.enum.shapes import MSO_SHAPE, MSO_CONNECTOR
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.dml import MSO_LINE_DASH_STYLE
 from pptx.dml.color import RGBColor
+from image_fetch import fetch_image, prefetch_images
+from image_normalize import normalize_image
+from assets import add_asset_picture
+from base_presentation import new_presentation
+from package_writer import save_presentation
+from slide_emitter import NO_FILL, SlideCanvas
+from synthesis_logic import clean_text
+from timings import StageTimer
 import os
 
 # Institutional Color Palette
@@ -20,27 +27,6 @@ SUCCESS_ZONE = RGBColor(34, 197, 94)  # Green-500
 WARNING_ZONE = RGBColor(234, 179, 8)  # Amber-500
 ORANGE_MARGIN = RGBColor(249, 115, 22) # Orange-500
 
-# --- TEXT CONSTRAINTS & CLEANING ---
-def clean_text(text, limit=30):
-    """
-    CLEANING PROTOCOL: Remove fillers, enforce FIXED word limit.
-    """
-    if not text or str(text).strip().lower() in ['n/a', 'none', 'x']: 
-        return "Not Specified"
-        
-    # Remove excessive whitespace
-    text = " ".join(str(text).split())
-    
-    # Filler Word Neutralization
-    fillers = {'basically', 'actually', 'literally', 'very', 'really', 'just', 'highly', 'extremely', 'quite', 'somewhat', 'a', 'the', 'is', 'are', 'we', 'our', 'will', 'help'}
-    words = text.split()
-    
-    # Force word limit
-    if len(words) > limit:
-        words = words[:limit]
-        
-    return " ".join(words)
-
 def disable_shadow(shape):
     """
     POLARIS PROTOCOL: Hard-disable all shadows for clean, modern aesthetics.
@@ -61,43 +47,32 @@ def set_slide_bg(slide):
     fill.solid()
     fill.fore_color.rgb = WHITE
 
-def add_header(slide, title="SLIDE TITLE"):
+def add_header(canvas, title="SLIDE TITLE"):
     # SLIDE FRAME (Institutional Safety Margin Definition with Orange Accent)
     m = 0.2
-    frame = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(m), Inches(m), Inches(10-2*m), Inches(7.5-2*m))
-    frame.fill.background(); frame.line.color.rgb = ORANGE_MARGIN; frame.line.width = Pt(1.5)
+    canvas.shape("rect", Inches(m), Inches(m), Inches(10-2*m), Inches(7.5-2*m), fill=NO_FILL, line=ORANGE_MARGIN, line_width=Pt(1.5))
 
     # INSTITUTIONAL LOGO (Top-Right Positioning)
-    if os.path.exists("institution_logo.png"):
-        logo = slide.shapes.add_picture("institution_logo.png", Inches(8.8), Inches(0.3), height=Inches(0.6))
-        disable_shadow(logo)
+    logo = add_asset_picture(canvas.direct(), "institution_logo.png", Inches(8.8), Inches(0.3), height=Inches(0.6))
+    if logo: disable_shadow(logo)
 
     # SLIDE TITLE (Centrally Aligned in Top Safety Zone)
-    header_box = slide.shapes.add_textbox(Inches(1.0), Inches(0.4), Inches(7.0), Inches(0.5))
-    disable_shadow(header_box)
-    p = header_box.text_frame.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(20); p.font.bold = True; p.font.name = 'Arial Black'
-    p.font.color.rgb = PRIMARY_COLOR
-    p.alignment = PP_ALIGN.LEFT
-
-def add_clean_box(slide, text, x, y, w, h, sz, bold=False, txt_color=TEXT_MAIN, border_color=None, bg_color=None):
-    box = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, x, y, w, h)
-    disable_shadow(box)
-    if bg_color:
-        box.fill.solid(); box.fill.fore_color.rgb = bg_color
-    else:
-        box.fill.background()
-    if border_color:
-        box.line.color.rgb = border_color; box.line.width = Pt(1)
-    else:
-        box.line.width = 0
-    tf = box.text_frame; tf.word_wrap = True
-    p = tf.paragraphs[0]; p.text = text
-    p.font.size = Pt(sz); p.font.bold = bold; p.font.color.rgb = txt_color
-
-
-def create_expert_deck(team_name, college, data):
+    canvas.textbox(Inches(1.0), Inches(0.4), Inches(7.0), Inches(0.5), title, Pt(20), True, PRIMARY_COLOR,
+                   align=PP_ALIGN.LEFT, font='Arial Black', shadow=False)
+
+def add_clean_box(canvas, text, x, y, w, h, sz, bold=False, txt_color=TEXT_MAIN, border_color=None, bg_color=None):
+    canvas.shape("rect", x, y, w, h, fill=bg_color or NO_FILL, line=border_color or None,
+                 line_width=Pt(1) if border_color else 0, shadow=False, text=(text, Pt(sz), bold, txt_color), wrap=True)
+
+
+def create_expert_deck(team_name, college, data, on_progress=None, out=None, timings=None):
+    """
+    Builds the 18-slide expert deck. on_progress(done, total, title) fires after each module slide.
+    Module slides are drawn on a SlideCanvas and emitted as XML in one pass per slide (see slide_emitter).
+    out may be a path or a writable stream; by default the deck lands in ppt_outputs/.
+    timings, when a dict, receives seconds per stage (cover, each module, closure, save).
+    """
+    timer = StageTimer(timings)
     # Ensure data is a dictionary for robust key access
     if isinstance(data, str):
         import json
@@ -107,7 +82,7 @@ def create_expert_deck(team_name, college, data):
     if not isinstance(data, dict):
         data = {}
 
-    prs = Presentation()
+    prs = new_presentation("deck")
     
     # ... (Cover Slide Logic - Unchanged)
     
@@ -121,8 +96,7 @@ def create_expert_deck(team_name, college, data):
     frame.fill.background(); frame.line.color.rgb = ORANGE_MARGIN; frame.line.width = Pt(1.5)
 
     # Logo (Centered at top)
-    if os.path.exists("institution_logo.png"):
-        slide.shapes.add_picture("institution_logo.png", Inches(4.35), Inches(0.5), height=Inches(0.8))
+    add_asset_picture(slide, "institution_logo.png", Inches(4.35), Inches(0.5), height=Inches(0.8))
 
     # Title (Large, Bold, Centered)
     tx_title = slide.shapes.add_textbox(Inches(1.0), Inches(1.6), Inches(8.0), Inches(1.0))
@@ -162,6 +136,10 @@ def create_expert_deck(team_name, college, data):
     p_members.text = f"MEMBERS: {data.get('memberNames', 'N/A').upper()}"; p_members.font.size = Pt(12); p_members.font.bold = False; p_members.font.color.rgb = TEXT_MAIN
 
 
+    # Evidence images download in the background while the slides before them are drawn
+    images = prefetch_images(evidence_urls(data))
+    timer.lap("cover")
+
     modules = [
         ("Background", lambda s: draw_strategic(s, data)),
         ("The Problem", lambda s: draw_problem(s, data)),
@@ -170,7 +148,7 @@ def create_expert_deck(team_name, college, data):
         ("Our User", lambda s: draw_persona(s, data)),
         ("What's Missing?", lambda s: draw_gap(s, data)),
         ("Our Solution", lambda s: draw_solution_statement(s, data)),
-        ("Evidence", lambda s: draw_prototype(s, data)),
+        ("Evidence", lambda s: draw_prototype(s, data, images)),
         ("How it Works", lambda s: draw_solution_flow(s, data)),
         ("The Plan", lambda s: draw_lean(s, data)),
         ("Growth", lambda s: draw_balloon(s, data)),
@@ -181,22 +159,28 @@ def create_expert_deck(team_name, college, data):
         ("The Future", lambda s: draw_vision(s, data))
     ]
 
-    for title, fn in modules:
+    for i, (title, fn) in enumerate(modules):
         s = prs.slides.add_slide(prs.slide_layouts[6]); set_slide_bg(s)
-        add_header(s, title); fn(s)
+        canvas = SlideCanvas(s)
+        add_header(canvas, title); fn(canvas); canvas.flush()
+        timer.lap(title)
+        if on_progress: on_progress(i + 1, len(modules), title)
 
     # CLOSURE
     slide = prs.slides.add_slide(prs.slide_layouts[6]); set_slide_bg(slide)
-    if os.path.exists("institution_logo.png"):
-        slide.shapes.add_picture("institution_logo.png", Inches(4.25), Inches(0.5), height=Inches(1.2))
+    add_asset_picture(slide, "institution_logo.png", Inches(4.25), Inches(0.5), height=Inches(1.2))
 
     tx = slide.shapes.add_textbox(Inches(0), Inches(3.2), Inches(10), Inches(1.5))
     p = tx.text_frame.paragraphs[0]; p.text = "THANK YOU."; p.font.size = Pt(64); p.font.bold = True; p.font.color.rgb = TEXT_MAIN; p.alignment = PP_ALIGN.CENTER
     add_footer(slide)
+    timer.lap("closure")
 
-    if not os.path.exists('ppt_outputs'): os.makedirs('ppt_outputs')
-    out = f"ppt_outputs/{team_name.lower().replace(' ', '_')}_pitch_artifact.pptx"
-    prs.save(out); return out
+    if out is None:
+        if not os.path.exists('ppt_outputs'): os.makedirs('ppt_outputs')
+        out = f"ppt_outputs/{team_name.lower().replace(' ', '_')}_pitch_artifact.pptx"
+    save_presentation(prs, out)
+    timer.lap("save")
+    return out
 
 # --- DRAWERS ---
 
@@ -241,8 +225,7 @@ def draw_persona(slide, data):
     
     # Avatar Circle
     cx, cy = 5.0, 4.3
-    c = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(cx-0.6), Inches(cy-0.6), Inches(1.2), Inches(1.2))
-    c.fill.solid(); c.fill.fore_color.rgb = PRIMARY_COLOR; c.line.color.rgb = WHITE; c.line.width = Pt(2)
+    slide.shape("ellipse", Inches(cx-0.6), Inches(cy-0.6), Inches(1.2), Inches(1.2), fill=PRIMARY_COLOR, line=WHITE, line_width=Pt(2))
     add_text_box_centered(slide, str(data.get('s6_customerName', 'PERSONA')).upper()[:10], cx-0.6, cy-0.15, 1.2, 0.3, 9, True, WHITE)
 
 
@@ -250,14 +233,12 @@ def draw_impact(slide, data):
     # Professional Visualization Grid
     x0, y0, w, h = 1.0, 1.8, 5.0, 4.8
     # Axes
-    slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Inches(x0), Inches(y0+h), Inches(x0+w+0.2), Inches(y0+h)).line.color.rgb = TEXT_MAIN
-    slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Inches(x0), Inches(y0+h), Inches(x0), Inches(y0-0.2)).line.color.rgb = TEXT_MAIN
+    slide.connector(Inches(x0), Inches(y0+h), Inches(x0+w+0.2), Inches(y0+h), TEXT_MAIN)
+    slide.connector(Inches(x0), Inches(y0+h), Inches(x0), Inches(y0-0.2), TEXT_MAIN)
     
     # Quadrant Lines (Target Centers)
-    q1 = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Inches(x0+w/2), Inches(y0), Inches(x0+w/2), Inches(y0+h))
-    q1.line.color.rgb = LINE_COLOR; q1.line.width = Pt(1); q1.line.dash_style = 2
-    q2 = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Inches(x0), Inches(y0+h/2), Inches(x0+w), Inches(y0+h/2))
-    q2.line.color.rgb = LINE_COLOR; q2.line.width = Pt(1); q2.line.dash_style = 2
+    slide.connector(Inches(x0+w/2), Inches(y0), Inches(x0+w/2), Inches(y0+h), LINE_COLOR, Pt(1), MSO_LINE_DASH_STYLE.SQUARE_DOT)
+    slide.connector(Inches(x0), Inches(y0+h/2), Inches(x0+w), Inches(y0+h/2), LINE_COLOR, Pt(1), MSO_LINE_DASH_STYLE.SQUARE_DOT)
     
     # Axis Labels (Watermarks removed as requested)
     add_text_box_simple(slide, "CRITICAL IMPACT ⭡", x0+0.1, y0 - 0.4, 2.0, 0.4, 10, True, ERROR_ZONE)
@@ -270,32 +251,27 @@ def draw_impact(slide, data):
         ix = m.get(p.get('freq'), 2); iy = m.get(p.get('impact'), 2)
         px = x0 + (ix/3.8)*w; py = (y0+h) - (iy/3.8)*h
         
-        dot = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(px-0.18), Inches(py-0.18), Inches(0.36), Inches(0.36))
-        disable_shadow(dot)
-        
         # COLOR-CODED IMPACT LOGIC
         imp_val = p.get('impact', 'Medium')
         dot_color = ERROR_ZONE # Default High
         if imp_val == 'Low': dot_color = SUCCESS_ZONE
         elif imp_val == 'Medium': dot_color = WARNING_ZONE
         
-        dot.fill.solid(); dot.fill.fore_color.rgb = dot_color; dot.line.color.rgb = WHITE; dot.line.width = Pt(1.5)
-        
-        tx_dot = slide.shapes.add_textbox(Inches(px-0.18), Inches(py-0.18), Inches(0.36), Inches(0.36))
-        disable_shadow(tx_dot)
-        p_dot = tx_dot.text_frame.paragraphs[0]; p_dot.text = str(i+1); p_dot.font.size=Pt(10); p_dot.font.bold=True; p_dot.font.color.rgb=WHITE; p_dot.alignment=PP_ALIGN.CENTER
+        slide.shape("ellipse", Inches(px-0.18), Inches(py-0.18), Inches(0.36), Inches(0.36), fill=dot_color, line=WHITE, line_width=Pt(1.5), shadow=False)
+        slide.textbox(Inches(px-0.18), Inches(py-0.18), Inches(0.36), Inches(0.36), str(i+1), Pt(10), True, WHITE, align=PP_ALIGN.CENTER, shadow=False)
         
         ly = y0 + (i * 0.6)
-        leg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(6.5), Inches(ly), Inches(3.2), Inches(0.5))
-        disable_shadow(leg)
-        leg.fill.solid(); leg.fill.fore_color.rgb = dot_color # Match legend to dot
-        leg.line.color.rgb = WHITE; leg.line.width = Pt(0.5)
-        p_leg = leg.text_frame.paragraphs[0]; p_leg.text = f"{i+1}. {clean_text(p['point'], 12)}"; p_leg.font.size=Pt(9); p_leg.font.bold=True; p_leg.font.color.rgb=WHITE
+        # Legend entry matches the dot colour
+        slide.shape("rect", Inches(6.5), Inches(ly), Inches(3.2), Inches(0.5), fill=dot_color, line=WHITE, line_width=Pt(0.5), shadow=False,
+                    text=(f"{i+1}. {clean_text(p['point'], 12)}", Pt(9), True, WHITE))
 
-def draw_prototype(slide, data):
+def evidence_urls(data):
     # Fetch images from data s8_5_img1, s8_5_img2, s8_5_img3
     images = [data.get(f's8_5_img{i}') for i in range(1, 4)]
-    images = [img for img in images if img and img.startswith('http')]
+    return [img for img in images if img and img.startswith('http')]
+
+def draw_prototype(slide, data, prefetched=None):
+    images = evidence_urls(data)
     
     if not images:
         add_text_box_centered(slide, "PROTOTYPE EVIDENCE NODES NOT UPLOADED", 1.0, 3.0, 8.0, 1.0, 24, True, LINE_COLOR)
@@ -317,10 +293,12 @@ def draw_prototype(slide, data):
     for i, url in enumerate(images[:3]):
         l, t, w, h = cfgs[i]
         try:
-            # Download image
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                img_stream = io.BytesIO(response.content)
+            # Download image (normally already in flight via prefetch_images)
+            result = prefetched[url].result() if prefetched and url in prefetched else fetch_image(url)
+            if result['status'] is None:
+                raise Exception(result['error'])
+            if result['status'] == 200:
+                img_stream = io.BytesIO(normalize_image(result['content'], w))
                 pic = slide.shapes.add_picture(img_stream, Inches(l), Inches(t), width=Inches(w))
                 disable_shadow(pic)
                 # Add border
@@ -339,15 +317,11 @@ def draw_prototype(slide, data):
 
 # --- HELPER FUNCTIONS ---
 
-def add_text_box_simple(slide, text, x, y, w, h, sz, b=False, cl=TEXT_MAIN):
-    tx = slide.shapes.add_textbox(Inches(x), Inches(y), Inches(w), Inches(h))
-    disable_shadow(tx)
-    p = tx.text_frame.paragraphs[0]; p.text = text; p.font.size = Pt(sz); p.font.bold = b; p.font.color.rgb = cl
+def add_text_box_simple(canvas, text, x, y, w, h, sz, b=False, cl=TEXT_MAIN):
+    canvas.textbox(Inches(x), Inches(y), Inches(w), Inches(h), text, Pt(sz), b, cl, shadow=False)
 
-def add_text_box_centered(slide, text, x, y, w, h, sz, b, cl):
-    tx = slide.shapes.add_textbox(Inches(x), Inches(y), Inches(w), Inches(h))
-    disable_shadow(tx)
-    p = tx.text_frame.paragraphs[0]; p.text = text; p.font.size = Pt(sz); p.font.bold = b; p.font.color.rgb = cl; p.alignment = PP_ALIGN.CENTER
+def add_text_box_centered(canvas, text, x, y, w, h, sz, b, cl):
+    canvas.textbox(Inches(x), Inches(y), Inches(w), Inches(h), text, Pt(sz), b, cl, align=PP_ALIGN.CENTER, shadow=False)
 
 def add_footer(slide, text=""):
     # Footer disabled as per watermark removal request
@@ -362,9 +336,8 @@ def draw_gap(slide, data):
 
 def draw_solution_statement(slide, data):
     add_clean_box(slide, "THE VENTURE UNVEILED", Inches(0.5), Inches(1.6), Inches(9), Inches(0.4), 12, True, PRIMARY_COLOR, BG_LIGHT, BG_LIGHT)
-    h_box = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0.5), Inches(2.1), Inches(9), Inches(2.8))
-    h_box.fill.solid(); h_box.fill.fore_color.rgb = WHITE; h_box.line.color.rgb = PRIMARY_COLOR; h_box.line.width = Pt(2)
-    p = h_box.text_frame.paragraphs[0]; p.text = clean_text(data.get('s8_solution'), 50); p.font.size = Pt(22); p.font.bold = True; p.font.color.rgb = TEXT_MAIN; p.alignment = PP_ALIGN.CENTER
+    slide.shape("rect", Inches(0.5), Inches(2.1), Inches(9), Inches(2.8), fill=WHITE, line=PRIMARY_COLOR, line_width=Pt(2),
+                text=(clean_text(data.get('s8_solution'), 50), Pt(22), True, TEXT_MAIN))
     add_clean_box(slide, "CORE TECHNOLOGY ARCHITECTURE", Inches(0.5), Inches(5.1), Inches(9), Inches(0.4), 12, True, SECONDARY_COLOR, BG_LIGHT, BG_LIGHT)
     add_clean_box(slide, clean_text(data.get('s8_coreTech'), 15), Inches(0.5), Inches(5.6), Inches(9), Inches(1.1), 16, False, PRIMARY_COLOR)
 
@@ -386,21 +359,13 @@ def draw_solution_flow(slide, data):
         
         # Add Horizontal Arrow Connector
         if col < 2 and (i + 1) < len(sps):
-            conn = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, 
-                                             Inches(px + bw), Inches(py + bh/2), 
-                                             Inches(px + bw + gx), Inches(py + bh/2))
-            conn.line.color.rgb = PRIMARY_COLOR
-            conn.line.width = Pt(1.5)
-            conn.line.end_arrowhead = 1
+            slide.connector(Inches(px + bw), Inches(py + bh/2), 
+                            Inches(px + bw + gx), Inches(py + bh/2), PRIMARY_COLOR, Pt(1.5))
 
         # Add Vertical Continuity Arrow between rows
         if col == 2 and row == 0 and len(sps) > 3:
-            v_conn = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT,
-                                              Inches(px + bw/2), Inches(py + bh),
-                                              Inches(px + bw/2), Inches(py + bh + gy))
-            v_conn.line.color.rgb = SECONDARY_COLOR
-            v_conn.line.width = Pt(1.5)
-            v_conn.line.end_arrowhead = 1
+            slide.connector(Inches(px + bw/2), Inches(py + bh),
+                            Inches(px + bw/2), Inches(py + bh + gy), SECONDARY_COLOR, Pt(1.5))
 
 def draw_lean(slide, data):
     w = 1.68; m = 0.8; pillars = [('PROBLEM','s10_leanProblem',m,4.0), ('SOLUTION','s10_leanSolution',m+w,2.0), ('USP','s10_leanUSP',m+2*w,4.0), ('ADVANTAGE','s10_leanUnfair',m+3*w,2.0), ('SEGMENTS','s10_leanSegments',m+4*w,4.0)]
@@ -415,16 +380,14 @@ def draw_lean(slide, data):
         add_clean_box(slide, clean_text(data.get(k), 15), Inches(x), Inches(6.1), Inches(w*2), Inches(0.9), 8, False, TEXT_MAIN, ACCENT_GREY, ACCENT_GREY)
 
 def draw_balloon(slide, data):
-    env = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(3.2), Inches(1.5), Inches(3.6), Inches(3.6))
-    env.fill.solid(); env.fill.fore_color.rgb = PRIMARY_COLOR; env.line.color.rgb = SECONDARY_COLOR; env.line.width = Pt(1)
+    slide.shape("ellipse", Inches(3.2), Inches(1.5), Inches(3.6), Inches(3.6), fill=PRIMARY_COLOR, line=SECONDARY_COLOR, line_width=Pt(1))
     add_text_box_centered(slide, "LIFTS (DRIVERS)", 3.4, 2.0, 3.2, 0.4, 12, True, WHITE)
     ls = "\n".join([f"• {clean_text(x, 6)}" for x in data.get('s11_lifts', []) if str(x).strip()][:4])
     add_text_box_centered(slide, ls, 3.4, 2.4, 3.2, 1.5, 10, False, WHITE)
-    bk = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(4.2), Inches(5.6), Inches(1.6), Inches(1.0))
-    bk.fill.solid(); bk.fill.fore_color.rgb = SECONDARY_COLOR; bk.line.width = 0
+    slide.shape("rect", Inches(4.2), Inches(5.6), Inches(1.6), Inches(1.0), fill=SECONDARY_COLOR, line_width=0)
     add_text_box_centered(slide, "VENTURE CORE", 4.2, 5.8, 1.6, 0.4, 11, True, WHITE)
-    slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Inches(3.7), Inches(4.8), Inches(4.2), Inches(5.6)).line.color.rgb=SECONDARY_COLOR
-    slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Inches(6.3), Inches(4.8), Inches(5.8), Inches(5.6)).line.color.rgb=SECONDARY_COLOR
+    slide.connector(Inches(3.7), Inches(4.8), Inches(4.2), Inches(5.6), SECONDARY_COLOR)
+    slide.connector(Inches(6.3), Inches(4.8), Inches(5.8), Inches(5.6), SECONDARY_COLOR)
     add_clean_box(slide, "PULLS (ANCHORS)", Inches(0.4), Inches(4.0), Inches(2.7), Inches(0.35), 11, True, ERROR_ZONE, BG_LIGHT, BG_LIGHT)
     pl = "\n".join([f"• {clean_text(x, 6)}" for x in data.get('s11_pulls', []) if str(x).strip()][:4])
     add_clean_box(slide, pl, Inches(0.4), Inches(4.4), Inches(2.7), Inches(1.8), 10)
@@ -433,72 +396,43 @@ def draw_balloon(slide, data):
     add_clean_box(slide, os, Inches(6.9), Inches(4.4), Inches(2.7), Inches(1.8), 10)
 
 def draw_market_matrix(slide, data):
-    rows = 4; cols = 4
+    rows = 4
     m = 0.8; w = 8.4
-    t = slide.shapes.add_table(rows, cols, Inches(m), Inches(1.8), Inches(w), Inches(5)).table
+    # Cells are (text, fill, font); None text leaves the cell blank
     hdrs = ["FEATURE / METRIC", "COMPETITOR 1", "COMPETITOR 2", "OUR VENTURE"]
-    for i, h in enumerate(hdrs):
-        c = t.cell(0, i); c.text = h; c.fill.solid(); c.fill.fore_color.rgb = PRIMARY_COLOR
-        p = c.text_frame.paragraphs[0]; p.font.size=Pt(11); p.font.bold=True; p.font.color.rgb=WHITE
+    cells = [[(h, PRIMARY_COLOR, (Pt(11), True, WHITE)) for h in hdrs]]
     
     f_rows = ["Market Depth", "Pricing Model", "Feature Richness", "Future Readiness"]
     comps = data.get('s12_competitors', [])
     our = data.get('s12_ourVenture', {})
     
+    def metric(entry, r, default):
+        if r == 1: return entry.get('strength', 'N/A')  # Market Depth
+        if r == 2: return entry.get('pricingModel', default)  # Pricing Model
+        if r == 3: return entry.get('featureRichness', default)  # Feature Richness
+        return default  # Future Readiness
+    
     for r in range(1, rows):
-        t.cell(r, 0).text = f_rows[r-1]
-        
-        # Competitor 1 data
-        if len(comps) > 0:
-            if r == 1:  # Market Depth
-                t.cell(r, 1).text = comps[0].get('strength', 'N/A')
-            elif r == 2:  # Pricing Model
-                t.cell(r, 1).text = comps[0].get('pricingModel', 'Baseline')
-            elif r == 3:  # Feature Richness
-                t.cell(r, 1).text = comps[0].get('featureRichness', 'Baseline')
-            else:  # Future Readiness
-                t.cell(r, 1).text = "Baseline"
-        
-        # Competitor 2 data
-        if len(comps) > 1:
-            if r == 1:  # Market Depth
-                t.cell(r, 2).text = comps[1].get('strength', 'N/A')
-            elif r == 2:  # Pricing Model
-                t.cell(r, 2).text = comps[1].get('pricingModel', 'Baseline')
-            elif r == 3:  # Feature Richness
-                t.cell(r, 2).text = comps[1].get('featureRichness', 'Baseline')
-            else:  # Future Readiness
-                t.cell(r, 2).text = "Baseline"
-        
-        # Our Venture data
-        if r == 1:  # Market Depth
-            t.cell(r, 3).text = our.get('strength', 'N/A')
-        elif r == 2:  # Pricing Model
-            t.cell(r, 3).text = our.get('pricingModel', 'Disruptive')
-        elif r == 3:  # Feature Richness
-            t.cell(r, 3).text = our.get('featureRichness', 'Disruptive')
-        else:  # Future Readiness
-            t.cell(r, 3).text = "Disruptive"
-        
+        texts = [f_rows[r-1],
+                 metric(comps[0], r, "Baseline") if len(comps) > 0 else None,
+                 metric(comps[1], r, "Baseline") if len(comps) > 1 else None,
+                 metric(our, r, "Disruptive")]
         # Apply styling
-        for c in range(cols):
-            p = t.cell(r, c).text_frame.paragraphs[0]; p.font.size = Pt(10)
-            if r % 2 == 0:
-                t.cell(r, c).fill.solid(); t.cell(r, c).fill.fore_color.rgb = ACCENT_GREY
+        fill = ACCENT_GREY if r % 2 == 0 else None
+        cells.append([(text, fill, (Pt(10), None, None)) for text in texts])
+    
+    slide.table(Inches(m), Inches(1.8), Inches(w), Inches(5), cells)
 
 def draw_market_sizing(slide, data):
     # Professional Bullseye Logic (TAM > SAM > SOM)
     cx, cy = 3.8, 3.8 # Center Point
-    configs = [ (4.4, PRIMARY_COLOR, 0.8), (3.2, SECONDARY_COLOR, 0.6), (2.0, ERROR_ZONE, 0.4) ]
-    for d, cl, tr in configs:
-        sh = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(cx-d/2), Inches(cy-d/2), Inches(d), Inches(d))
-        disable_shadow(sh)
-        sh.fill.solid(); sh.fill.fore_color.rgb = cl; sh.fill.transparency = tr
-        sh.line.color.rgb = cl; sh.line.width = Pt(1.5)
+    configs = [ (4.4, PRIMARY_COLOR), (3.2, SECONDARY_COLOR), (2.0, ERROR_ZONE) ]
+    for d, cl in configs:
+        slide.shape("ellipse", Inches(cx-d/2), Inches(cy-d/2), Inches(d), Inches(d), fill=cl, line=cl, line_width=Pt(1.5), shadow=False)
     
     lbls = [("TAM", 's13_tam', PRIMARY_COLOR, 2.0), ("SAM", 's13_sam', SECONDARY_COLOR, 2.8), ("SOM", 's13_som', ERROR_ZONE, 3.6)]
     for i, (name, key, col, y_pos) in enumerate(lbls):
-        slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Inches(cx+0.5), Inches(y_pos), Inches(7.0), Inches(y_pos)).line.color.rgb = col
+        slide.connector(Inches(cx+0.5), Inches(y_pos), Inches(7.0), Inches(y_pos), col)
         add_text_box_simple(slide, f"{name}: {data.get(key, 'N/A')}", 7.1, y_pos-0.2, 2.5, 0.4, 15, True, col)
 
     add_clean_box(slide, "VALUATION LOGIC & SOURCE DATA", Inches(0.8), Inches(6.1), Inches(8.4), Inches(0.35), 10, True, PRIMARY_COLOR, None, BG_LIGHT)
@@ -523,33 +457,14 @@ def draw_fiscal(slide, data):
         except: pass
 
     rows = len(als) + 2 # Header + Data + Total
-    t = slide.shapes.add_table(rows, 2, Inches(1), Inches(2.0), Inches(8), Inches(min(5, rows*0.6))).table
-    t.cell(0,0).text = "ALLOCATION NODE"; t.cell(0,1).text = "VALUATION / PURPOSE (₹)"
+    cells = [[("ALLOCATION NODE", PRIMARY_COLOR, (Pt(11), True, WHITE)), ("VALUATION / PURPOSE (₹)", PRIMARY_COLOR, (Pt(11), True, WHITE))]]
+    # Body and total cells take the table style's font (their text replaces the styled paragraph)
+    for r, a in enumerate(als, start=1):
+        fill = ACCENT_GREY if r % 2 == 0 else WHITE
+        cells.append([(a['category'].upper(), fill, None), (f"₹ {a['amount']}", fill, None)])
+    cells.append([("TOTAL FISCAL ALLOCATION", SECONDARY_COLOR, None), (f"₹ {total:,.2f}", SECONDARY_COLOR, None)])
     
-    for r in range(rows):
-        for c in range(2):
-            cell = t.cell(r,c); cell.fill.solid()
-            # Styling branching
-            is_header = (r == 0)
-            is_total = (r == rows - 1)
-            
-            if is_header:
-                cell.fill.fore_color.rgb = PRIMARY_COLOR
-            elif is_total:
-                cell.fill.fore_color.rgb = SECONDARY_COLOR
-            else:
-                cell.fill.fore_color.rgb = ACCENT_GREY if r % 2 == 0 else WHITE
-                
-            p = cell.text_frame.paragraphs[0]
-            p.font.size = Pt(14 if is_total else 11)
-            p.font.bold = is_header or is_total
-            p.font.color.rgb = WHITE if (is_header or is_total) else TEXT_MAIN
-            
-            if r > 0 and r < rows - 1:
-                idx = r - 1
-                cell.text = als[idx]['category'].upper() if c == 0 else f"₹ {als[idx]['amount']}"
-            elif is_total:
-                cell.text = "TOTAL FISCAL ALLOCATION" if c == 0 else f"₹ {total:,.2f}"
+    slide.table(Inches(1), Inches(2.0), Inches(8), Inches(min(5, rows*0.6)), cells)
 
 def draw_vision(slide, data):
     m = 0.8; w = 8.4
@@ -1,12 +1,16 @@
 # ppt-service/generator.py
-from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
+from assets import add_asset_picture
+from base_presentation import new_presentation
+from package_writer import save_presentation
+from timings import StageTimer
 import os
 
-def create_pptx(team_name, college, slides_data):
-    prs = Presentation()
+def create_pptx(team_name, college, slides_data, out=None, timings=None):
+    timer = StageTimer(timings)
+    prs = new_presentation("deck")
     
     def add_branding(slide):
         # 1. Top Left - Event Branding
@@ -18,8 +22,7 @@ def create_pptx(team_name, college, slides_data):
         p.font.color.rgb = RGBColor(13, 148, 136) # Teal
         
         # 2. Top Right - Logo
-        if os.path.exists("institution_logo.png"):
-            slide.shapes.add_picture("institution_logo.png", Inches(8.5), Inches(0.2), width=Inches(1.2))
+        add_asset_picture(slide, "institution_logo.png", Inches(8.5), Inches(0.2), width=Inches(1.2))
 
     def set_dark_bg(slide):
         background = slide.background
@@ -31,8 +34,7 @@ def create_pptx(team_name, college, slides_data):
     slide = prs.slides.add_slide(prs.slide_layouts[6]) # Blank layout
     
     # Logo (Centered at top)
-    if os.path.exists("institution_logo.png"):
-        slide.shapes.add_picture("institution_logo.png", Inches(4.35), Inches(0.5), height=Inches(0.8))
+    add_asset_picture(slide, "institution_logo.png", Inches(4.35), Inches(0.5), height=Inches(0.8))
 
     # Title Text (Large, Bold, Centered)
     tx_title = slide.shapes.add_textbox(Inches(1.0), Inches(1.6), Inches(8.0), Inches(1.0))
@@ -83,6 +85,8 @@ def create_pptx(team_name, college, slides_data):
     p_members = tf_t.add_paragraph(); p_members.alignment = PP_ALIGN.CENTER
     p_members.text = f"MEMBERS: {slides_data.get('memberNames', 'N/A').upper()}"; p_members.font.size = Pt(12); p_members.font.bold = False; p_members.font.name = 'Times New Roman'
 
+    timer.lap("cover")
+
     # 2. Add Content Slides
     from pptx.enum.shapes import MSO_SHAPE
     
@@ -117,6 +121,13 @@ def create_pptx(team_name, college, slides_data):
             p.font.size = Pt(22)
             p.font.color.rgb = RGBColor(0, 0, 0)
             p.space_after = Pt(12)
+    timer.lap("slides")
+
+    # In-memory target (path or writable stream) supplied by the caller
+    if out is not None:
+        save_presentation(prs, out)
+        timer.lap("save")
+        return out
 
     # Save the file
     file_name = f"ppt_outputs/{team_name.lower().replace(' ', '_')}_pitch_artifact.pptx"
@@ -125,5 +136,6 @@ def create_pptx(team_name, college, slides_data):
     if not os.path.exists('ppt_outputs'):
         os.makedirs('ppt_outputs')
         
-    prs.save(file_name)
+    save_presentation(prs, file_name)
+    timer.lap("save")
     return file_name
\ No newline at end of file
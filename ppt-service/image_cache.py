@@ -0,0 +1,81 @@
+# ppt-service/image_cache.py
+import os
+import threading
+import time
+
+# On-disk copies of downloaded evidence images (see image_fetch) and of their slide-sized re-encodings (image_normalize)
+IMAGE_CACHE_DIR = os.getenv("IMAGE_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "image_cache"))
+NORMALIZED_CACHE_DIR = os.getenv("NORMALIZED_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "image_cache", "normalized"))
+# One size budget shared by both directories; 0 disables on-disk image caching
+IMAGE_CACHE_MAX_BYTES = int(os.getenv("IMAGE_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+
+# Temp files younger than this still belong to a running writer
+_TMP_GRACE_SECONDS = 600
+
+class ImageDiskCache:
+    """
+    Byte cap with least-recently-used eviction over directories that every render worker writes into.
+    There is no shared in-memory index: readers bump mtimes, and a process re-scans the directories on
+    its first write and again after each eighth of the budget it writes.
+    """
+
+    def __init__(self, dirs, max_bytes=IMAGE_CACHE_MAX_BYTES):
+        self.dirs = dirs
+        self.max_bytes = max_bytes
+        self.evicted = 0
+        self._written = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.max_bytes > 0
+
+    def touch(self, path):
+        try: os.utime(path)
+        except OSError: pass
+
+    def wrote(self, size):
+        """
+        Accounts for size bytes just written, trimming the directories when this process has written enough.
+        """
+        with self._lock:
+            due = self._written is None or self._written + size > self.max_bytes // 8
+            self._written = 0 if due else self._written + size
+        if due: self.trim()
+
+    def _entries(self):
+        # Files sharing a name stem in one directory (body, metadata, temp copies) form one entry
+        now = time.time()
+        entries = {}
+        for d in {os.path.realpath(d) for d in self.dirs}:
+            try: listing = list(os.scandir(d))
+            except OSError: continue
+            for entry in listing:
+                try:
+                    if not entry.is_file(): continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                if entry.name.endswith(".tmp") and now - st.st_mtime < _TMP_GRACE_SECONDS: continue
+                used, size, paths = entries.get((d, entry.name.split(".", 1)[0]), (0, 0, ()))
+                entries[(d, entry.name.split(".", 1)[0])] = (max(used, st.st_mtime), size + st.st_size, paths + (entry.path,))
+        return list(entries.values())
+
+    def trim(self):
+        """
+        Removes the least recently used entries until the directories fit max_bytes. Returns the bytes freed.
+        """
+        entries = self._entries()
+        excess = sum(size for _, size, _ in entries) - self.max_bytes
+        freed = 0
+        for _, size, paths in sorted(entries):
+            if freed >= excess: break
+            for path in paths:
+                try: os.remove(path)
+                except OSError: pass
+            freed += size
+            self.evicted += 1
+        if freed: print(f"[IMAGES] Cache trimmed by {freed} bytes")
+        return freed
+
+image_cache = ImageDiskCache((IMAGE_CACHE_DIR, NORMALIZED_CACHE_DIR))
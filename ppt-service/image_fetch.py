@@ -0,0 +1,164 @@
+# ppt-service/image_fetch.py
+from collections import deque
+from image_cache import IMAGE_CACHE_DIR, image_cache
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit
+import hashlib
+import json
+import os
+import threading
+import time
+import requests
+
+# Evidence image fetch layer: pooled connections, concurrent prefetch, disk cache, negative host cache
+IMAGE_FETCH_TIMEOUT = float(os.getenv("IMAGE_FETCH_TIMEOUT", 5))
+IMAGE_FETCH_WORKERS = int(os.getenv("IMAGE_FETCH_WORKERS", 4))
+# Cached copies younger than this are served without revalidating against the origin
+IMAGE_FRESH_SECONDS = int(os.getenv("IMAGE_FRESH_SECONDS", 300))
+# Hosts that time out or refuse connections are skipped for this long
+IMAGE_NEGATIVE_TTL = int(os.getenv("IMAGE_NEGATIVE_TTL", 60))
+
+_session = None
+_pool = None
+_init_lock = threading.Lock()
+_failed_hosts = {}  # host -> retry-after timestamp
+_failed_lock = threading.Lock()
+# (outcome, seconds) of recent fetches in this process, collected per render by drain_fetch_log()
+_fetch_log = deque(maxlen=256)
+
+def _get_session():
+    global _session
+    with _init_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max(16, IMAGE_FETCH_WORKERS))
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+        return _session
+
+def _get_pool():
+    global _pool
+    with _init_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=IMAGE_FETCH_WORKERS, thread_name_prefix="image-fetch")
+        return _pool
+
+def _entry_paths(url):
+    digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    base = os.path.join(IMAGE_CACHE_DIR, digest)
+    return base + ".bin", base + ".json"
+
+def _load_cached(url):
+    if not image_cache.enabled: return None, None
+    body_path, meta_path = _entry_paths(url)
+    try:
+        with open(meta_path) as f: meta = json.load(f)
+        with open(body_path, 'rb') as f: content = f.read()
+    except (OSError, ValueError):
+        return None, None
+    image_cache.touch(body_path)
+    return meta, content
+
+def _atomic_write(path, data, mode='wb'):
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, mode) as f: f.write(data)
+    os.replace(tmp, path)
+
+def _store(url, response, content):
+    if not image_cache.enabled: return
+    body_path, meta_path = _entry_paths(url)
+    meta = {
+        "url": url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "fetched_at": time.time()
+    }
+    try:
+        if not os.path.exists(IMAGE_CACHE_DIR): os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+        if content is not None: _atomic_write(body_path, content)
+        _atomic_write(meta_path, json.dumps(meta), 'w')
+    except OSError as e:
+        print(f"[IMAGES] Cache write failed for {url}: {e}")
+        return
+    if content is not None: image_cache.wrote(len(content))
+
+def _host_blocked(host):
+    with _failed_lock:
+        until = _failed_hosts.get(host)
+        if until and until > time.time(): return True
+        _failed_hosts.pop(host, None)
+        return False
+
+def _mark_host_failed(host):
+    with _failed_lock:
+        _failed_hosts[host] = time.time() + IMAGE_NEGATIVE_TTL
+
+def fetch_image(url):
+    """
+    Fetches one image. Returns {"url", "status", "content", "error", "source", "elapsed"} and never raises:
+    status is the HTTP status (None when the transfer itself failed), source is "network", "cache" or "stale".
+    """
+    start = time.perf_counter()
+    result = _fetch(url)
+    result["elapsed"] = time.perf_counter() - start
+    _fetch_log.append((fetch_outcome(result), result["elapsed"]))
+    return result
+
+def fetch_outcome(result):
+    if result["status"] is None: return "error"
+    if result["status"] != 200: return f"http_{result['status']}"
+    return result["source"]
+
+def drain_fetch_log():
+    entries = []
+    while _fetch_log:
+        try: entries.append(_fetch_log.popleft())
+        except IndexError: break
+    return entries
+
+def _fetch(url):
+    host = urlsplit(url).netloc
+    meta, cached = _load_cached(url)
+    if cached is not None and time.time() - meta.get("fetched_at", 0) < IMAGE_FRESH_SECONDS:
+        return {"url": url, "status": 200, "content": cached, "error": None, "source": "cache"}
+
+    if _host_blocked(host):
+        if cached is not None:
+            return {"url": url, "status": 200, "content": cached, "error": None, "source": "stale"}
+        return {"url": url, "status": None, "content": None, "error": f"host {host} recently unreachable", "source": "network"}
+
+    headers = {}
+    if cached is not None:
+        if meta.get("etag"): headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"): headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        response = _get_session().get(url, timeout=IMAGE_FETCH_TIMEOUT, headers=headers)
+    except (requests.Timeout, requests.ConnectionError) as e:
+        _mark_host_failed(host)
+        if cached is not None:
+            return {"url": url, "status": 200, "content": cached, "error": None, "source": "stale"}
+        return {"url": url, "status": None, "content": None, "error": str(e), "source": "network"}
+    except Exception as e:
+        return {"url": url, "status": None, "content": None, "error": str(e), "source": "network"}
+
+    if response.status_code == 304 and cached is not None:
+        _store(url, response, None)
+        return {"url": url, "status": 200, "content": cached, "error": None, "source": "cache"}
+    if response.status_code == 200:
+        content = response.content
+        _store(url, response, content)
+        return {"url": url, "status": 200, "content": content, "error": None, "source": "network"}
+    return {"url": url, "status": response.status_code, "content": None, "error": f"HTTP {response.status_code}", "source": "network"}
+
+def prefetch_images(urls):
+    """
+    Starts downloading every URL concurrently. Returns {url: Future[result of fetch_image]}.
+    """
+    pool = _get_pool()
+    futures = {}
+    for url in urls:
+        if url not in futures:
+            futures[url] = pool.submit(fetch_image, url)
+    return futures
@@ -0,0 +1,100 @@
+# ppt-service/image_normalize.py
+from io import BytesIO
+from PIL import Image
+from image_cache import NORMALIZED_CACHE_DIR, image_cache
+import hashlib
+import os
+import threading
+
+# Evidence pictures are resampled to the pixels they actually occupy on the slide
+IMAGE_NORMALIZE = os.getenv("IMAGE_NORMALIZE", "1") != "0"
+IMAGE_TARGET_DPI = int(os.getenv("IMAGE_TARGET_DPI", 150))
+IMAGE_MAX_BYTES = int(os.getenv("IMAGE_MAX_BYTES", 400 * 1024))
+JPEG_QUALITY_STEPS = (85, 75, 65, 55)
+
+def _cache_path(content, width_in):
+    h = hashlib.sha256(content)
+    h.update(f"|{width_in:.3f}|{IMAGE_TARGET_DPI}|{IMAGE_MAX_BYTES}".encode())
+    return os.path.join(NORMALIZED_CACHE_DIR, h.hexdigest() + ".bin")
+
+def _has_alpha(img):
+    return img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+
+def _target_size(img, width_in):
+    """
+    Pixel size for a picture placed at width_in (add_picture derives the height from the aspect ratio).
+    Never upscales.
+    """
+    scale = min(1.0, max(1, int(width_in * IMAGE_TARGET_DPI)) / img.width)
+    return max(1, round(img.width * scale)), max(1, round(img.height * scale))
+
+def _encode(img, exif):
+    """
+    Re-encodes within IMAGE_MAX_BYTES: PNG for transparent images, otherwise JPEG stepping quality down.
+    """
+    if _has_alpha(img):
+        out = BytesIO()
+        img.save(out, "PNG", optimize=True)
+        return out.getvalue()
+
+    if img.mode != "RGB": img = img.convert("RGB")
+    data = None
+    for quality in JPEG_QUALITY_STEPS:
+        out = BytesIO()
+        params = {"quality": quality, "optimize": True}
+        if exif: params["exif"] = exif
+        img.save(out, "JPEG", **params)
+        data = out.getvalue()
+        if len(data) <= IMAGE_MAX_BYTES: break
+    return data
+
+def normalize_image(content, width_in):
+    """
+    Decodes, downsamples to the slide box width at IMAGE_TARGET_DPI and re-encodes under the byte budget.
+    Returns the original bytes when they are already small enough or cannot be decoded.
+    Results are cached on disk by (content hash, box width, settings), under the image cache budget.
+    """
+    if not IMAGE_NORMALIZE or not content: return content
+
+    cache_path = _cache_path(content, width_in) if image_cache.enabled else None
+    if cache_path:
+        try:
+            with open(cache_path, 'rb') as f: cached = f.read()
+            image_cache.touch(cache_path)
+            return cached
+        except OSError:
+            pass
+
+    try:
+        img = Image.open(BytesIO(content))
+        img.load()
+    except Exception as e:
+        print(f"[IMAGES] Normalization skipped (undecodable): {e}")
+        return content
+
+    fmt = img.format
+    size = _target_size(img, width_in)
+    if size == img.size and len(content) <= IMAGE_MAX_BYTES and fmt in ("JPEG", "PNG"):
+        result = content
+    else:
+        # EXIF orientation is kept so the picture renders exactly as the original did
+        exif = img.info.get("exif")
+        if img.mode not in ("RGB", "RGBA", "L", "LA"):
+            img = img.convert("RGBA" if _has_alpha(img) else "RGB")
+        if size != img.size:
+            img = img.resize(size, Image.LANCZOS)
+        result = _encode(img, exif)
+        if len(result) >= len(content) and fmt in ("JPEG", "PNG"):
+            result = content
+
+    if not cache_path: return result
+    try:
+        if not os.path.exists(NORMALIZED_CACHE_DIR): os.makedirs(NORMALIZED_CACHE_DIR, exist_ok=True)
+        tmp = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, 'wb') as f: f.write(result)
+        os.replace(tmp, cache_path)
+    except OSError as e:
+        print(f"[IMAGES] Normalized cache write failed: {e}")
+        return result
+    image_cache.wrote(len(result))
+    return result
@@ -0,0 +1,128 @@
+# ppt-service/jobs.py
+from singleflight import check_fingerprint
+import asyncio
+import os
+import queue
+import threading
+import time
+import uuid
+
+# Finished jobs stay queryable for this long before being pruned
+JOB_TTL_SECONDS = int(os.getenv("JOB_TTL_SECONDS", 3600))
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+TERMINAL = (DONE, FAILED)
+
+class JobRegistry:
+    """
+    In-memory ledger for asynchronous renders.
+    All state lives on the event loop: worker progress is marshalled onto it by the pump thread,
+    and every change bumps the job version and wakes SSE subscribers.
+    """
+
+    def __init__(self, ttl=JOB_TTL_SECONDS):
+        self.ttl = ttl
+        self._jobs = {}
+        self._keys = {}  # submission key -> (job_id, body fingerprint) (see find)
+
+    def create(self, kind, team_name, key=None, fingerprint=None):
+        self._prune()
+        job_id = uuid.uuid4().hex
+        if key is not None: self._keys[key] = (job_id, fingerprint)
+        now = time.time()
+        self._jobs[job_id] = {
+            "job_id": job_id, "kind": kind, "team_name": team_name, "status": QUEUED,
+            "done": 0, "total": 0, "current": None,
+            "file_url": None, "location": None, "error": None,
+            "created_at": now, "updated_at": now,
+            "version": 0, "event": asyncio.Event()
+        }
+        return job_id
+
+    def find(self, key, finished=False, fingerprint=None):
+        """
+        The job last submitted under key while it is still in flight; with finished, also once it is done
+        (for as long as it is retained). A failed job is never returned, so its key can be retried.
+        """
+        job_id, first = self._keys.get(key, (None, None))
+        job = self._jobs.get(job_id)
+        if job is None or job["status"] == FAILED or (job["status"] == DONE and not finished): return None
+        check_fingerprint(first, fingerprint)
+        return job["job_id"]
+
+    def get(self, job_id):
+        job = self._jobs.get(job_id)
+        return self._public(job) if job else None
+
+    def update(self, job_id, **fields):
+        job = self._jobs.get(job_id)
+        if not job: return
+        # Late worker events must not resurrect a finished job
+        if job["status"] in TERMINAL and fields.get("status") not in TERMINAL: return
+        job.update(fields)
+        if fields.get("status") == DONE and job["total"]:
+            job["done"] = job["total"]
+        job["updated_at"] = time.time()
+        job["version"] += 1
+        event, job["event"] = job["event"], asyncio.Event()
+        event.set()
+
+    def apply(self, message):
+        """
+        Folds one worker progress tuple ("running", job_id) / ("progress", job_id, done, total, title).
+        """
+        kind, job_id = message[0], message[1]
+        if kind == "running":
+            self.update(job_id, status=RUNNING)
+        elif kind == "progress":
+            done, total, title = message[2:5]
+            self.update(job_id, status=RUNNING, done=done, total=total, current=title)
+
+    async def watch(self, job_id, timeout=15):
+        """
+        Async iterator over job snapshots: yields on every change, None on idle timeout (keep-alive).
+        """
+        seen = -1
+        while True:
+            job = self._jobs.get(job_id)
+            if not job: return
+            if job["version"] != seen:
+                seen = job["version"]
+                snapshot = self._public(job)
+                yield snapshot
+                if snapshot["status"] in TERMINAL: return
+                continue
+            try:
+                await asyncio.wait_for(job["event"].wait(), timeout)
+            except asyncio.TimeoutError:
+                yield None
+
+    def pump(self, source, loop):
+        """
+        Starts a daemon thread that drains worker progress from a multiprocessing queue onto the loop.
+        """
+        def drain():
+            while not loop.is_closed():
+                try:
+                    message = source.get(timeout=1)
+                except queue.Empty:
+                    continue
+                except (EOFError, OSError, ValueError):
+                    return
+                try:
+                    loop.call_soon_threadsafe(self.apply, message)
+                except RuntimeError:
+                    return
+        thread = threading.Thread(target=drain, name="job-progress-pump", daemon=True)
+        thread.start()
+        return thread
+
+    def _prune(self):
+        cutoff = time.time() - self.ttl
+        stale = [k for k, j in self._jobs.items() if j["status"] in TERMINAL and j["updated_at"] < cutoff]
+        for k in stale: del self._jobs[k]
+        self._keys = {key: entry for key, entry in self._keys.items() if entry[0] in self._jobs}
+
+    @staticmethod
+    def _public(job):
+        return {k: v for k, v in job.items() if k not in ("event", "version")}
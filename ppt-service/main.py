@@ -1,14 +1,28 @@
 # ppt-service/main.py
-from fastapi import FastAPI, HTTPException, Request, Body
-from pydantic import BaseModel
-from synthesis_logic import polish_content
-from generator import create_pptx
-from expert_synthesis import create_expert_deck
-from certificate_engine import create_certificate
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, HTTPException, Request, Body, Query
+from render_pool import RENDER_WORKERS, complete_render, get_executor, get_progress_queue, prestart, run_in_pool, render_deck, render_deck_bytes, render_deck_job, render_certificate, render_certificate_bytes, render_certificate_bundle, render_certificate_bundle_bytes, shutdown as shutdown_render_pool
+from jobs import JobRegistry, DONE, FAILED
+from artifact_cache import ArtifactCache, cache_key, source_fingerprint
+from assets import ASSETS
+from storage import PPTX_MEDIA_TYPE, create_storage
+from artifact_index import ArtifactIndex, is_artifact_name, is_plain_name
+from retention import RetentionManager
+from metrics import observe_output, observe_request, render_latest
+from warmup import WARMUP_ON_START, warm_up
+from zip_stream import stream_zip
+from schemas import CertificateBatchRequest, CertificateRequest, DeckRequest, read_body
+from singleflight import IdempotencyConflict, SingleFlight
+from pdf_export import PdfConverter, PdfUnavailable, release as release_pdf
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+from urllib.parse import quote
+from typing import List
 import uvicorn
+import asyncio
 import os
+import hashlib
 import json
+import time
 import traceback
 
 app = FastAPI(title="Institutional Synthesis Hub 4.5")
@@ -17,131 +31,621 @@ app = FastAPI(title="Institutional Synthesis Hub 4.5")
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 OUT_DIR = os.path.join(BASE_DIR, "ppt_outputs")
 CERTS_DIR = os.path.join(BASE_DIR, "certs_outputs")
+CACHE_DIR = os.path.join(BASE_DIR, "artifact_cache")
+PDF_CACHE_DIR = os.path.join(BASE_DIR, "pdf_cache")
+
+ENGINE_VERSION = "v4.5.0-PROD"
+# Cached decks are tied to the engine release and the exact renderer sources/assets
+GENERATOR_VERSION = f"{ENGINE_VERSION}+" + source_fingerprint(
+    [os.path.join(BASE_DIR, f) for f in ("generator.py", "expert_synthesis.py", "synthesis_logic.py", "image_normalize.py", "assets.py", "slide_emitter.py", "base_presentation.py", "institution_logo.png")])
+
+# Certificates are filled into a cached per-event skeleton unless explicitly disabled
+CERT_TEMPLATE_MODE = os.getenv("CERT_TEMPLATE_MODE", "1") != "0"
 
 if not os.path.exists(OUT_DIR): os.makedirs(OUT_DIR)
 if not os.path.exists(CERTS_DIR): os.makedirs(CERTS_DIR)
 
+artifact_cache = ArtifactCache(CACHE_DIR)
+
+# Headless LibreOffice pool for PDF exports (see /vault/{kind}/{filename}/pdf), started on first use
+pdf_converter = PdfConverter(PDF_CACHE_DIR)
+
+# Finished artifacts are pushed here as soon as they are rendered (local vaults or S3-compatible)
+storage = create_storage({"outputs": OUT_DIR, "certs": CERTS_DIR}, {"outputs": "/outputs", "certs": "/certs"})
+
+# Vault registry: counts, lookups and metadata without directory scans
+artifact_index = ArtifactIndex({"outputs": OUT_DIR, "certs": CERTS_DIR})
+retention = RetentionManager(artifact_index)
+
+async def _publish(kind, path, team=None):
+    """
+    Pushes a rendered artifact to the storage backend off the event loop and records it in the index.
+    Returns its final location.
+    """
+    location = await asyncio.to_thread(storage.put, kind, os.path.basename(path), path)
+    meta = artifact_index.record(kind, artifact_index.path(kind, os.path.basename(path)), team=team)
+    observe_output(kind, meta["size"])
+    if storage.remote:
+        # Already durable in the bucket, so the local copy is the first to go under retention
+        artifact_index.mark(kind, os.path.basename(path), synced=True)
+    return location
+
+# Asynchronous render jobs (see /jobs endpoints)
+jobs = JobRegistry()
+
+# Identical renders in flight (retries, double clicks, backend fail-over) share one result (see _idempotency_key)
+flights = SingleFlight()
+_job_tasks = set()
+
+# Readiness probe state (see /ready); without warm-up the service is ready as soon as it listens
+readiness = {"ready": not WARMUP_ON_START, "workers": 0, "warmup": None, "error": None}
+
+async def _warm_and_prestart():
+    """
+    Warms this process (templates, assets, one render per engine), then forks the render workers from it,
+    so they start warm. /ready turns 200 only once this finished.
+    """
+    try:
+        readiness["warmup"] = await asyncio.to_thread(warm_up)
+        readiness["workers"] = await asyncio.to_thread(prestart)
+    except Exception as e:
+        # Still serve: renders work cold, they are just slower
+        traceback.print_exc()
+        readiness["error"] = str(e)
+    readiness["ready"] = True
+
+@app.on_event("startup")
+async def boot_render_pool():
+    get_executor()
+    jobs.pump(get_progress_queue(), asyncio.get_running_loop())
+    retention.start()
+    if WARMUP_ON_START:
+        task = asyncio.create_task(_warm_and_prestart())
+        _job_tasks.add(task); task.add_done_callback(_job_tasks.discard)
+
+@app.on_event("shutdown")
+def release_render_pool():
+    retention.stop()
+    shutdown_render_pool()
+
+@app.on_event("shutdown")
+async def release_pdf_workers():
+    await pdf_converter.stop()
+
+def _pptx_response(data, filename, kind):
+    """
+    Direct-streaming mode (?stream=true): the .pptx travels back in the same response, no disk or callback.
+    """
+    observe_output(kind, len(data))
+    return Response(content=data, media_type=PPTX_MEDIA_TYPE, headers={"Content-Disposition": _attachment(filename)})
+
+def _idempotency_key(request):
+    """
+    Client-chosen request identity (Idempotency-Key header, scoped to the route). Without one, requests
+    are coalesced on their content; with one, a finished result is also replayed to retries for a while,
+    and the key is bound to a digest of the body it came with (a different body gets 422).
+    """
+    key = request.headers.get("idempotency-key", "").strip()
+    return ("idempotency", request.url.path, key) if key else None
+
+def _conflict(e):
+    return HTTPException(status_code=422, detail=str(e))
+
+def _attachment(filename):
+    fallback = filename.encode('ascii', 'replace').decode().replace('"', '_')
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename)}"
+
+@app.middleware("http")
+async def record_latency(request: Request, call_next):
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Label by route template (/certs/{filename}), never the raw path, to keep cardinality bounded
+        route = request.scope.get("route")
+        observe_request(request.method, getattr(route, "path", "unmatched"), status, time.perf_counter() - start)
+
 # --- DIAGNOSTIC TOOLS ---
+@app.get("/metrics")
+def metrics():
+    body, content_type = render_latest()
+    return Response(content=body, media_type=content_type)
+
+@app.get("/ready")
+def ready():
+    """
+    Readiness probe (point the platform health check here): 503 until warm-up and worker prestart finished.
+    /health stays a pure liveness check.
+    """
+    return JSONResponse(readiness, status_code=200 if readiness["ready"] else 503)
+
 @app.get("/")
 @app.get("/health")
 def health():
-    files = [f for f in os.listdir(OUT_DIR) if f.endswith('.pptx')]
-    cert_files = [f for f in os.listdir(CERTS_DIR) if f.endswith('.pptx')]
     return {
         "status": "online", 
-        "artifact_count": len(files),
-        "credential_count": len(cert_files),
-        "engine": "v4.5.0-PROD"
+        "ready": readiness["ready"],
+        "artifact_count": artifact_index.count("outputs"),
+        "credential_count": artifact_index.count("certs"),
+        "artifact_cache": artifact_cache.stats(),
+        "coalescing": flights.stats(),
+        "pdf": pdf_converter.stats(),
+        "retention": retention.stats(),
+        "assets": {name: asset.sha1[:12] for name, asset in ASSETS.items()},
+        "storage": storage.name,
+        "engine": ENGINE_VERSION
     }
 
 # --- ARTIFACT DELIVERY ---
+def _resolve_artifact(kind, filename):
+    """
+    Maps a requested name to the stored vault file via the index; a .pptx dropped into the vault
+    out-of-band is picked up (and indexed) on its first request. Names with a path component never resolve.
+    """
+    if not is_plain_name(filename): return None
+    stored = artifact_index.lookup(kind, filename)
+    if stored is None and is_artifact_name(filename) and os.path.isfile(artifact_index.path(kind, filename)):
+        stored = artifact_index.record(kind, artifact_index.path(kind, filename))['filename']
+    return stored
+
 @app.get("/outputs/{filename}")
 def get_artifact(filename: str):
-    file_path = os.path.join(OUT_DIR, filename)
-    if os.path.exists(file_path):
-        return FileResponse(file_path)
+    stored = _resolve_artifact("outputs", filename)
+    if stored:
+        retention.touch("outputs", stored)
+        return FileResponse(artifact_index.path("outputs", stored))
     raise HTTPException(status_code=404, detail=f"Artifact not found in vault.")
 
+@app.post("/vault/{kind}/{filename}/synced")
+def mark_synced(kind: str, filename: str):
+    """
+    Lets the backend report that it has copied an artifact elsewhere, making it the first eviction candidate.
+    """
+    if kind not in artifact_index.vaults:
+        raise HTTPException(status_code=404, detail=f"Unknown vault [{kind}].")
+    stored = artifact_index.lookup(kind, filename.strip())
+    if not stored:
+        raise HTTPException(status_code=404, detail=f"Artifact [{filename}] not found in vault.")
+    artifact_index.mark(kind, stored, synced=True)
+    return {"success": True, "file_url": stored}
+
+# --- BULK DELIVERY ---
+def _archive_members(kind, team=None, prefix=None, files=None):
+    """
+    Picks vault artifacts by explicit names, owning team and/or filename prefix (all given filters apply).
+    """
+    if files:
+        requested = [str(f).strip() for f in files]
+        bad = next((f for f in requested if not is_plain_name(f)), None)
+        if bad is not None:
+            raise HTTPException(status_code=400, detail=f"Invalid artifact name [{bad}].")
+        names = {stored for stored in (_resolve_artifact(kind, f) for f in requested) if stored}
+    else:
+        names = {meta['filename'] for meta in artifact_index.entries(kind)}
+    selected = []
+    for name in sorted(names):
+        meta = artifact_index.get(kind, name)
+        if meta is None: continue
+        if team and (meta['team'] or '').casefold() != team.strip().casefold(): continue
+        if prefix and not name.casefold().startswith(prefix.strip().casefold()): continue
+        selected.append(name)
+    return selected
+
+async def _archive_response(kind, team=None, prefix=None, files=None, fmt="pptx"):
+    """
+    Streams a ZIP of the selected artifacts straight from the vault: stored entries, no temp files,
+    memory flat regardless of archive size. fmt="pdf" zips their PDF exports instead, converted in
+    parallel over the PDF workers (each unchanged artifact only once, see pdf_export.py).
+    """
+    if kind not in artifact_index.vaults:
+        raise HTTPException(status_code=404, detail=f"Unknown vault [{kind}].")
+    if fmt not in ("pptx", "pdf"):
+        raise HTTPException(status_code=400, detail="'format' must be pptx or pdf.")
+    if not (team or prefix or files):
+        raise HTTPException(status_code=400, detail="Select artifacts by team, prefix or files.")
+    # Members are checked on disk before the headers go out, so X-Archive-Count is what the ZIP holds
+    members = [(name, artifact_index.path(kind, name)) for name in _archive_members(kind, team, prefix, files)]
+    members = [(name, path) for name, path in members if os.path.isfile(path)]
+    if not members:
+        raise HTTPException(status_code=404, detail="No matching artifacts in vault.")
+    for name, _ in members: retention.touch(kind, name)
+    label = (team or prefix or "selection").strip().lower().replace(' ', '_')
+    print(f"[SHIELD] Archive Pull: {len(members)} from {kind} ({label}, {fmt})")
+
+    owned = []
+    if fmt == "pdf":
+        converted = await asyncio.gather(*(_convert_pdf(path) for _, path in members), return_exceptions=True)
+        owned = [result[0] for result in converted if isinstance(result, tuple) and not result[1]]
+        failure = next((result for result in converted if isinstance(result, BaseException)), None)
+        if failure is not None:
+            for path in owned: release_pdf(path, False)
+            raise failure
+        members = [(_pdf_name(name), pdf_path) for (name, _), (pdf_path, _) in zip(members, converted)]
+        label += "_pdf"
+    chunks = stream_zip(members)
+    return StreamingResponse(_release_after(chunks, owned) if owned else chunks, media_type="application/zip",
+                             headers={"Content-Disposition": _attachment(f"{kind}_{label}.zip"), "X-Archive-Count": str(len(members))})
+
+@app.get("/vault/{kind}/archive")
+async def get_archive(kind: str, team: str = None, prefix: str = None, files: List[str] = Query(None), format: str = "pptx"):
+    return await _archive_response(kind, team, prefix, files, format)
+
+@app.post("/vault/{kind}/archive")
+async def post_archive(kind: str, data: dict = Body(...)):
+    """
+    Same as GET, for explicit lists too long for a query string: {"files": [...], "team": ..., "prefix": ..., "format": ...}.
+    """
+    files = data.get('files')
+    if files is not None and not isinstance(files, list):
+        raise HTTPException(status_code=400, detail="'files' must be a list of filenames.")
+    return await _archive_response(kind, data.get('team'), data.get('prefix'), files, data.get('format') or "pptx")
+
+# --- PDF EXPORT ---
+async def _convert_pdf(path):
+    try:
+        return await pdf_converter.convert(path)
+    except PdfUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        traceback.print_exc()
+        raise HTTPException(status_code=502, detail=f"PDF conversion failed: {e}")
+
+def _pdf_name(name):
+    return os.path.splitext(name)[0] + ".pdf"
+
+def _release_after(chunks, paths):
+    try:
+        yield from chunks
+    finally:
+        for path in paths: release_pdf(path, False)
+
+@app.get("/vault/{kind}/{filename}/pdf")
+async def get_pdf(kind: str, filename: str):
+    """
+    Print-ready PDF of a vault artifact; a certificate bundle becomes one page per participant.
+    Each distinct file content is converted once, later pulls come from the PDF cache.
+    """
+    if kind not in artifact_index.vaults:
+        raise HTTPException(status_code=404, detail=f"Unknown vault [{kind}].")
+    stored = _resolve_artifact(kind, filename.strip())
+    if not stored:
+        raise HTTPException(status_code=404, detail=f"Artifact [{filename}] not found in vault.")
+    retention.touch(kind, stored)
+    print(f"[SHIELD] PDF Pull: {stored}")
+    path, cached = await _convert_pdf(artifact_index.path(kind, stored))
+    return FileResponse(path, media_type="application/pdf", headers={"Content-Disposition": _attachment(_pdf_name(stored))},
+                        background=None if cached else BackgroundTask(release_pdf, path, cached))
+
 # --- CERTIFICATE SYNTHESIS & DELIVERY ---
+DEFAULT_EVENT_NAME = "BHARAT BRILLIANT HACKATHON"
+
+def _certificate_job(p, defaults=None):
+    """
+    Turns one validated participant (CertificateRequest) into a render job for the certificate engine.
+    """
+    defaults = defaults or {}
+    p_date = p.submission_date or defaults.get('submission_date')
+    if not p_date or p_date == "None" or p_date == "null":
+        p_date = "[Submission Date]"
+    
+    # Sanitize name for filename persistence
+    p_name_clean = p.name.strip()
+    safe_name = p_name_clean.lower().replace(' ', '_')
+    out_filename = f"certificate_{safe_name}.pptx"
+    return {
+        "name": p_name_clean,
+        "college": p.college,
+        "year": p.year,
+        "dept": p.dept,
+        "role": p.role,
+        "event_name": p.event_name or defaults.get('event_name') or DEFAULT_EVENT_NAME,
+        "submission_date": p_date,
+        "out_path": os.path.abspath(os.path.join(CERTS_DIR, out_filename)),
+        "team": p.team_name or defaults.get('team_name'),
+        "use_template": CERT_TEMPLATE_MODE
+    }
+
+async def _certificate_result(job):
+    """
+    render_certificate through the shared flights: a participant already rendering (from a single request
+    or a batch) is rendered once. Returns a copy of the shared result, which callers may annotate.
+    """
+    identity = tuple(sorted(job.items()))
+    return dict(await flights.run(("certificate", identity), lambda: run_in_pool(render_certificate, job)))
+
+async def _certificate_file(job):
+    out_path = job['out_path']
+    print(f"[SYNTHESIS] Generating credential for {job['name']} at {out_path}")
+    
+    # Core Synthesis Call (off-loop, in the render pool)
+    result = await _certificate_result(job)
+    
+    # Verify serialization
+    if not result['success']:
+        print(f"[CRITICAL] Serialization failed for {out_path}")
+        raise Exception(result['error'])
+    print(f"[SUCCESS] Certificate persisted: {out_path} ({os.path.getsize(out_path)} bytes)")
+
+    return {
+        "success": True,
+        "file_url": result['file_url'],
+        "location": await _publish("certs", out_path, job['team'])
+    }
+
 @app.post("/generate-certificate")
-def certificate_handler(data: dict = Body(...)):
+async def certificate_handler(request: Request, stream: bool = False):
+    data = await read_body(request, CertificateRequest)
     try:
-        p_name = data.get('name', 'Participant')
-        p_college = data.get('college', 'Institution')
-        p_year = data.get('year', 'N/A')
-        p_dept = data.get('dept', 'N/A')
-        p_role = data.get('role', 'MEMBER')
-        p_date = data.get('submission_date')
-        if not p_date or p_date == "None" or p_date == "null":
-            p_date = "[Submission Date]"
-        
-        # Sanitize name for filename persistence
-        p_name_clean = str(p_name).strip()
-        safe_name = p_name_clean.lower().replace(' ', '_')
-        out_filename = f"certificate_{safe_name}.pptx"
-        out_path = os.path.abspath(os.path.join(CERTS_DIR, out_filename))
-        
-        print(f"[SYNTHESIS] Generating credential for {p_name_clean} at {out_path}")
-        
-        # Core Synthesis Call
-        create_certificate(p_name_clean, p_college, p_year, p_dept, p_role, submission_date=p_date, out_path=out_path)
-        
-        # Verify serialization
-        if not os.path.exists(out_path):
-            print(f"[CRITICAL] Serialization failed for {out_path}")
-            print(f"[DEBUG] Directory dump: {os.listdir(CERTS_DIR)}")
-            raise Exception("Synthesis failed to serialize artifact.")
-        else:
-            print(f"[SUCCESS] Certificate persisted: {out_path} ({os.path.getsize(out_path)} bytes)")
-            print(f"[DEBUG] Vault Contents: {os.listdir(CERTS_DIR)}")
+        job = _certificate_job(data)
+        identity = tuple(sorted(job.items()))
+        idempotency = _idempotency_key(request)
+        flight = idempotency or ("certificate", identity)
+        fingerprint = identity if idempotency else None
+
+        if stream:
+            print(f"[SYNTHESIS] Streaming credential for {job['name']}")
+            cert = await flights.run(flight + ("stream",), lambda: run_in_pool(render_certificate_bytes, job), fingerprint=fingerprint)
+            return _pptx_response(cert, os.path.basename(job['out_path']), "certs")
+
+        return await flights.run(flight + ("file",), lambda: _certificate_file(job), remember=idempotency is not None, fingerprint=fingerprint)
+    except IdempotencyConflict as e:
+        raise _conflict(e)
+    except Exception as e:
+        print(f"CRITICAL: {str(e)}")
+        traceback.print_exc()
+        return {"success": False, "error": str(e)}
+
+@app.post("/generate-certificates/batch")
+async def certificate_batch_handler(request: Request, stream: bool = False):
+    """
+    Renders a whole list of participants in one call, fanned out over the render pool.
+    Shared 'event_name' / 'submission_date' apply to every participant unless overridden.
+    With "bundle": true all participants land in one presentation instead (see _certificate_bundle).
+    """
+    data = await read_body(request, CertificateBatchRequest)
+    try:
+        if not data.participants:
+            return {"success": False, "error": "Participants Missing"}
+
+        defaults = {"event_name": data.event_name, "submission_date": data.submission_date, "team_name": data.team_name}
+        records = data.records()
+        cert_jobs = [_certificate_job(p, defaults) for p in records if p is not None]
+        if data.bundle:
+            return await _certificate_bundle(cert_jobs, data, len(records) - len(cert_jobs), stream)
+
+        print(f"[SYNTHESIS] Batch of {len(cert_jobs)} credentials across {RENDER_WORKERS} workers")
+        rendered = await asyncio.gather(*(_certificate_result(job) for job in cert_jobs))
+        await asyncio.gather(*(_publish_certificate(job, r) for job, r in zip(cert_jobs, rendered)))
+        rendered = iter(rendered)
+        results = [next(rendered) if p is not None else {"name": None, "success": False, "error": "Invalid participant record"} for p in records]
+        failed = sum(1 for r in results if not r['success'])
 
         return {
-            "success": True,
-            "file_url": out_filename 
+            "success": failed == 0,
+            "generated": len(results) - failed,
+            "failed": failed,
+            "results": results
         }
     except Exception as e:
         print(f"CRITICAL: {str(e)}")
         traceback.print_exc()
         return {"success": False, "error": str(e)}
 
+def _bundle_filename(data, cert_jobs):
+    label = data.bundle_name or data.team_name
+    if not label:
+        # Same participant list -> same file, so re-running a batch replaces its bundle
+        label = "batch_" + hashlib.sha1("\0".join(job['name'] for job in cert_jobs).encode('utf-8')).hexdigest()[:10]
+    return f"certificates_{str(label).strip().lower().replace(' ', '_').replace('/', '_')}.pptx"
+
+async def _certificate_bundle(cert_jobs, data, skipped, stream=False):
+    """
+    BUNDLE MODE: one .pptx with a slide per participant (shared master, theme and logo, a single save).
+    Lands in the certs vault under certificates_<bundle_name | team_name | batch digest>.pptx.
+    """
+    if not cert_jobs:
+        return {"success": False, "error": "No valid participant records"}
+    filename = _bundle_filename(data, cert_jobs)
+    print(f"[SYNTHESIS] Bundling {len(cert_jobs)} credentials into {filename}")
+    if stream:
+        return _pptx_response(await run_in_pool(render_certificate_bundle_bytes, cert_jobs), filename, "certs")
+
+    out_path = os.path.join(CERTS_DIR, filename)
+    result = await run_in_pool(render_certificate_bundle, cert_jobs, out_path)
+    if not result['success']:
+        return result
+    return {
+        "success": skipped == 0,
+        "bundle": True,
+        "generated": result['count'],
+        "failed": skipped,
+        "file_url": result['file_url'],
+        "location": await _publish("certs", out_path, data.team_name)
+    }
+
+async def _publish_certificate(job, result):
+    if not result['success']: return
+    try:
+        result['location'] = await _publish("certs", job['out_path'], job['team'])
+    except Exception as e:
+        result.update(success=False, error=f"Storage push failed: {e}")
+
 @app.get("/certs/{filename}")
 def get_credential(filename: str):
     # Normalize filename request
     clean_filename = filename.strip()
-    file_path = os.path.abspath(os.path.join(CERTS_DIR, clean_filename))
-    
-    print(f"[SHIELD] Credential Pull: {clean_filename} (Resolved: {file_path})")
     
-    if os.path.exists(file_path):
-        return FileResponse(file_path)
-    
-    # Second-chance lookup (case-insensitive)
-    try:
-        all_files = os.listdir(CERTS_DIR)
-        for f in all_files:
-            if f.lower() == clean_filename.lower():
-                return FileResponse(os.path.join(CERTS_DIR, f))
-    except: pass
+    # Exact match first, then the case-insensitive second chance, both served from the index
+    stored = _resolve_artifact("certs", clean_filename)
+    print(f"[SHIELD] Credential Pull: {clean_filename} (Resolved: {stored})")
+    if stored:
+        retention.touch("certs", stored)
+        return FileResponse(artifact_index.path("certs", stored))
 
-    raise HTTPException(status_code=404, detail=f"Credential [{clean_filename}] not found. Path: {file_path}. Available: {os.listdir(CERTS_DIR)}")
+    raise HTTPException(status_code=404, detail=f"Credential [{clean_filename}] not found.")
 
 # --- CORE MISSION SYNTHESIS ---
+def _deck_request(data):
+    return data.team_name, data.college_name, data.payload
+
+def _deck_keys(request, endpoint, data, team_name, college_name, payload):
+    """
+    (cache key, submission key, fingerprint) for a deck request. The submission key is the Idempotency-Key
+    when one is sent, otherwise the content digest plus no_cache: equal submissions share one render.
+    Under an Idempotency-Key, fingerprint (digest of the normalized body) must match on every reuse;
+    otherwise it is None.
+    """
+    digest = cache_key(endpoint, team_name, college_name, payload, GENERATOR_VERSION)
+    idempotency = _idempotency_key(request)
+    submission = idempotency or ("deck", endpoint, data.no_cache, digest)
+    return None if data.no_cache else digest, submission, (digest, data.no_cache) if idempotency else None
+
+def _deck_filename(team_name):
+    return f"{team_name.lower().replace(' ', '_')}_pitch_artifact.pptx"
+
+async def _restore_cached_deck(key, team_name):
+    """
+    On a cache hit, re-publishes the stored deck under the team's artifact name without rendering.
+    """
+    if not key: return None
+    out_filename = _deck_filename(team_name)
+    if await asyncio.to_thread(artifact_cache.restore, key, os.path.join(OUT_DIR, out_filename)):
+        print(f"[CACHE] Hit for {team_name} ({key[:12]})")
+        return out_filename
+    return None
+
+async def _cache_render(key, deck, report, team_name):
+    """
+    Stores a fresh render under key, unless an evidence image failed to load: a deck drawn with placeholders
+    would otherwise be served from the cache long after the image host recovered.
+    """
+    if not key: return
+    if complete_render(report):
+        await asyncio.to_thread(artifact_cache.put, key, deck)
+    else:
+        print(f"[CACHE] Not caching {team_name} ({key[:12]}): evidence images missing")
+
 @app.post("/generate-artifact")
 @app.post("/generate-expert-pitch")
-def unified_handler(data: dict = Body(...)):
+async def unified_handler(request: Request, stream: bool = False):
+    data = await read_body(request, DeckRequest)
     try:
-        team_name = data.get('team_name', 'Unnamed_Team')
-        college_name = data.get('college_name', 'Institution')
-        payload = data.get('content') or data.get('project_data')
+        team_name, college_name, payload = _deck_request(data)
         
         if not payload: return {"success": False, "error": "Context Missing"}
 
-        # Logic Branching
-        is_expert = False
-        if isinstance(payload, dict) and 'projectName' in payload:
-            is_expert = True
-        elif isinstance(payload, str) and 'projectName' in payload:
-            is_expert = True
-
-        if is_expert:
-            if isinstance(payload, str):
-                try:
-                    payload = json.loads(payload)
-                except:
-                    pass
-            file_path = create_expert_deck(team_name, college_name, payload)
-        else:
-            processed = polish_content(payload)
-            file_path = create_pptx(team_name, college_name, processed)
-        
-        return {
-            "success": True, 
-            "file_url": os.path.basename(file_path)
-        }
+        key, submission, fingerprint = _deck_keys(request, request.url.path, data, team_name, college_name, payload)
+        if stream:
+            deck = await flights.run(submission + ("stream",), lambda: _deck_bytes(key, team_name, college_name, payload), fingerprint=fingerprint)
+            return _pptx_response(deck, _deck_filename(team_name), "outputs")
+        return await flights.run(submission + ("file",), lambda: _deck_file(key, team_name, college_name, payload),
+                                 remember=fingerprint is not None, fingerprint=fingerprint)
+    except IdempotencyConflict as e:
+        raise _conflict(e)
     except Exception as e:
         traceback.print_exc()
         return {"success": False, "error": str(e)}
 
+async def _deck_bytes(key, team_name, college_name, payload):
+    deck = await asyncio.to_thread(artifact_cache.read, key) if key else None
+    if deck is None:
+        report = {}
+        deck = await run_in_pool(render_deck_bytes, team_name, college_name, payload, report=report)
+        await _cache_render(key, deck, report, team_name)
+    return deck
+
+async def _deck_file(key, team_name, college_name, payload):
+    cached = await _restore_cached_deck(key, team_name)
+    if cached:
+        location = await _publish("outputs", os.path.join(OUT_DIR, cached), team_name)
+        return {"success": True, "file_url": cached, "location": location, "cached": True}
+
+    # Rendering is CPU-bound: hand it to the process pool and keep the loop responsive
+    report = {}
+    file_path = await run_in_pool(render_deck, team_name, college_name, payload, report=report)
+    await _cache_render(key, file_path, report, team_name)
+    
+    return {
+        "success": True, 
+        "file_url": os.path.basename(file_path),
+        "location": await _publish("outputs", file_path, team_name)
+    }
+
+# --- ASYNCHRONOUS JOBS ---
+# Jobs share cache entries with the synchronous endpoint they mirror
+JOB_ENDPOINTS = {"/jobs/artifact": "/generate-artifact", "/jobs/expert-pitch": "/generate-expert-pitch"}
+
+@app.post("/jobs/artifact")
+@app.post("/jobs/expert-pitch")
+async def submit_job(request: Request):
+    """
+    Queues a deck render and returns immediately. Poll /jobs/{job_id} or stream /jobs/{job_id}/events.
+    """
+    data = await read_body(request, DeckRequest)
+    team_name, college_name, payload = _deck_request(data)
+    if not payload: return {"success": False, "error": "Context Missing"}
+
+    key, submission, fingerprint = _deck_keys(request, JOB_ENDPOINTS.get(request.url.path, request.url.path), data, team_name, college_name, payload)
+    try:
+        existing = jobs.find(submission, finished=fingerprint is not None, fingerprint=fingerprint)
+    except IdempotencyConflict as e:
+        raise _conflict(e)
+    if existing:
+        # Same submission still running (or, under an Idempotency-Key, already done): hand out that job
+        return {"success": True, "job_id": existing, "status": jobs.get(existing)["status"], "shared": True}
+
+    job_id = jobs.create("deck", team_name, key=submission, fingerprint=fingerprint)
+    try:
+        cached = await _restore_cached_deck(key, team_name)
+        if cached:
+            location = await _publish("outputs", os.path.join(OUT_DIR, cached), team_name)
+            jobs.update(job_id, status=DONE, file_url=cached, location=location)
+            return {"success": True, "job_id": job_id, "status": DONE, "cached": True}
+    except Exception as e:
+        # The job is already registered under this submission: leaving it queued would hand it to every retry
+        jobs.update(job_id, status=FAILED, error=str(e))
+        raise
+
+    task = asyncio.create_task(_run_job(job_id, key, team_name, college_name, payload))
+    _job_tasks.add(task); task.add_done_callback(_job_tasks.discard)
+    return {"success": True, "job_id": job_id, "status": "queued"}
+
+async def _run_job(job_id, key, team_name, college_name, payload):
+    try:
+        report = {}
+        file_path = await run_in_pool(render_deck_job, job_id, team_name, college_name, payload, report=report)
+        await _cache_render(key, file_path, report, team_name)
+        location = await _publish("outputs", file_path, team_name)
+        jobs.update(job_id, status=DONE, file_url=os.path.basename(file_path), location=location)
+    except Exception as e:
+        traceback.print_exc()
+        jobs.update(job_id, status=FAILED, error=str(e))
+
+@app.get("/jobs/{job_id}")
+async def job_status(job_id: str):
+    job = jobs.get(job_id)
+    if not job: raise HTTPException(status_code=404, detail="Job not found or expired.")
+    return job
+
+@app.get("/jobs/{job_id}/events")
+async def job_events(job_id: str):
+    """
+    Server-Sent Events: one event per state change (named after the status), keep-alive comments while idle.
+    """
+    if not jobs.get(job_id): raise HTTPException(status_code=404, detail="Job not found or expired.")
+
+    async def stream():
+        async for snapshot in jobs.watch(job_id):
+            if snapshot is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"event: {snapshot['status']}\ndata: {json.dumps(snapshot)}\n\n"
+
+    return StreamingResponse(stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
     uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
@@ -0,0 +1,55 @@
+# ppt-service/metrics.py
+from prometheus_client import CONTENT_TYPE_LATEST, Gauge, Histogram, generate_latest
+
+# Render stages run from a few ms (a text box) to seconds (evidence downloads)
+STAGE_BUCKETS = (.001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (64e3, 128e3, 256e3, 512e3, 1e6, 2e6, 4e6, 8e6, 16e6, 32e6)
+
+REQUEST_LATENCY = Histogram("ppt_http_request_duration_seconds", "HTTP request latency by route",
+                            ["method", "endpoint", "status"], buckets=STAGE_BUCKETS + (30, 60))
+RENDER_DURATION = Histogram("ppt_render_duration_seconds", "Wall time of one render inside a pool worker",
+                            ["task", "engine", "outcome"], buckets=STAGE_BUCKETS + (30, 60))
+RENDER_STAGE = Histogram("ppt_render_stage_seconds", "Time per drawer/stage of a render (expert deck: one per module)",
+                         ["engine", "stage"], buckets=STAGE_BUCKETS)
+SAVE_DURATION = Histogram("ppt_save_seconds", "Package serialization time (save_presentation)", ["engine"], buckets=STAGE_BUCKETS)
+IMAGE_FETCH = Histogram("ppt_image_fetch_seconds", "Evidence image fetch time by outcome", ["outcome"], buckets=STAGE_BUCKETS)
+PDF_CONVERT = Histogram("ppt_pdf_convert_seconds", "PDF export time by outcome (cached, converted, failed)", ["outcome"],
+                        buckets=STAGE_BUCKETS + (30, 60))
+OUTPUT_BYTES = Histogram("ppt_output_bytes", "Size of delivered .pptx artifacts", ["kind"], buckets=SIZE_BUCKETS)
+RENDERS_IN_FLIGHT = Gauge("ppt_renders_in_flight", "Renders currently executing in pool workers")
+RENDERS_QUEUED = Gauge("ppt_renders_queued", "Renders waiting for a free pool worker")
+
+def track_render_queue(pending, workers):
+    """
+    Derives the in-flight/queued gauges from the number of renders handed to the pool (pending()).
+    """
+    RENDERS_IN_FLIGHT.set_function(lambda: min(pending(), workers))
+    RENDERS_QUEUED.set_function(lambda: max(0, pending() - workers))
+
+def observe_request(method, endpoint, status, seconds):
+    REQUEST_LATENCY.labels(method, endpoint, str(status)).observe(seconds)
+
+def observe_render(task, report, outcome="ok"):
+    """
+    Records the measurements a worker sent back with its result (see render_pool._instrumented).
+    """
+    report = report or {}
+    engine = report.get("engine", "none")
+    if "seconds" in report:
+        RENDER_DURATION.labels(task, engine, outcome).observe(report["seconds"])
+    for stage, seconds in report.get("stages", {}).items():
+        if stage == "save":
+            SAVE_DURATION.labels(engine).observe(seconds)
+        else:
+            RENDER_STAGE.labels(engine, stage).observe(seconds)
+    for image_outcome, seconds in report.get("images", ()):
+        IMAGE_FETCH.labels(image_outcome).observe(seconds)
+
+def observe_pdf(outcome, seconds):
+    PDF_CONVERT.labels(outcome).observe(seconds)
+
+def observe_output(kind, size):
+    OUTPUT_BYTES.labels(kind).observe(size)
+
+def render_latest():
+    return generate_latest(), CONTENT_TYPE_LATEST
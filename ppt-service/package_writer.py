@@ -0,0 +1,160 @@
+# ppt-service/package_writer.py
+from collections import OrderedDict
+from pptx.opc.serialized import PackageWriter
+from atomic_files import discard, temp_path
+from assets import ASSETS
+import hashlib
+import os
+import struct
+import threading
+import time
+import zlib
+
+# Deflate level for saved packages: 1 favours speed, 9 size, 0 stores parts uncompressed
+PACKAGE_COMPRESS_LEVEL = int(os.getenv("PACKAGE_COMPRESS_LEVEL", 6))
+# Compressed static parts (master, layouts, theme, logos) kept per process; 0 disables the cache
+PACKAGE_CACHE_MAX_BYTES = int(os.getenv("PACKAGE_CACHE_MAX_BYTES", 16 * 1024 * 1024))
+
+# Slide XML and slide rels change on every render; deflating them into the cache would only evict the static parts
+_FRESH_PREFIX = "ppt/slides/"
+# Media is static only when it is a registered asset (logos); evidence pictures are new with every deck
+_MEDIA_PREFIX = "ppt/media/"
+
+_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+_CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+_END_RECORD = struct.Struct("<IHHHHIIH")
+
+class CompressedPartCache:
+    """
+    Deflated part bodies keyed by (membername, sha1 of the blob, level), evicted least-recently-used by size.
+    Content addressing means a changed part can never be served stale.
+    """
+
+    def __init__(self, max_bytes=PACKAGE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (method, crc, size, data)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry):
+        if self.max_bytes <= 0 or len(entry[3]) > self.max_bytes: return
+        with self._lock:
+            if key in self._entries: return
+            self._entries[key] = entry
+            self._bytes += len(entry[3])
+            while self._bytes > self.max_bytes:
+                _, old = self._entries.popitem(last=False)
+                self._bytes -= len(old[3])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        return {"entries": len(self._entries), "bytes": self._bytes, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses, "level": PACKAGE_COMPRESS_LEVEL}
+
+part_cache = CompressedPartCache()
+
+def _compress(blob, level):
+    crc = zlib.crc32(blob)
+    if level <= 0: return (0, crc, len(blob), blob)
+    c = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return (8, crc, len(blob), c.compress(blob) + c.flush())
+
+def _dos_time(ts):
+    t = time.localtime(ts)
+    return (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2), ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+
+class _CachedZipWriter:
+    """
+    Physical package writer with the _ZipPkgWriter interface (write(pack_uri, blob) inside a with block),
+    emitting the zip records itself so cached deflate streams can be copied in verbatim.
+    """
+
+    def __init__(self, pkg_file, level, cache):
+        self._pkg_file = pkg_file
+        self._level = level
+        self._cache = cache
+        self._central = []
+        self._offset = 0
+        self._time, self._date = _dos_time(time.time())
+        self._static_media = {bytes.fromhex(asset.sha1) for asset in ASSETS.values()} if cache is not None else ()
+
+    def __enter__(self):
+        # Paths are written to a temp sibling and renamed into place once complete (see atomic_files)
+        self._own = isinstance(self._pkg_file, (str, os.PathLike))
+        self._tmp = temp_path(os.fspath(self._pkg_file)) if self._own else None
+        self._fp = open(self._tmp, "wb") if self._own else self._pkg_file
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        ok = False
+        try:
+            if exc_type is None: self._finish()
+            ok = exc_type is None
+        finally:
+            if self._own:
+                self._fp.close()
+                if ok: os.replace(self._tmp, self._pkg_file)
+                else: discard(self._tmp)
+
+    def write(self, pack_uri, blob):
+        name = pack_uri.membername
+        digest = hashlib.sha1(blob).digest() if self._cache is not None and not name.startswith(_FRESH_PREFIX) else None
+        if digest is not None and (not name.startswith(_MEDIA_PREFIX) or digest in self._static_media):
+            key = (name, digest, self._level)
+            entry = self._cache.get(key)
+            if entry is None:
+                entry = _compress(blob, self._level)
+                self._cache.put(key, entry)
+        else:
+            entry = _compress(blob, self._level)
+        self._add(name.encode("utf-8"), *entry)
+
+    def _add(self, name, method, crc, size, data):
+        header = _LOCAL_HEADER.pack(0x04034B50, 20, 0, method, self._time, self._date, crc, len(data), size, len(name), 0)
+        self._central.append(_CENTRAL_HEADER.pack(0x02014B50, 20, 20, 0, method, self._time, self._date, crc, len(data), size,
+                                                  len(name), 0, 0, 0, 0, 0o600 << 16, self._offset) + name)
+        self._fp.write(header); self._fp.write(name); self._fp.write(data)
+        self._offset += len(header) + len(name) + len(data)
+
+    def _finish(self):
+        directory = b"".join(self._central)
+        self._fp.write(directory)
+        self._fp.write(_END_RECORD.pack(0x06054B50, 0, 0, len(self._central), len(self._central), len(directory), self._offset, 0))
+
+class _CachedPackageWriter(PackageWriter):
+    level = PACKAGE_COMPRESS_LEVEL
+    cache = part_cache
+
+    def _write(self):
+        # Stored (level 0) parts cost no more to copy than to hash, so only deflated output is cached
+        cache = self.cache if self.cache.max_bytes > 0 and self.level > 0 else None
+        with _CachedZipWriter(self._pkg_file, self.level, cache) as phys_writer:
+            self._write_content_types_stream(phys_writer)
+            self._write_pkg_rels(phys_writer)
+            self._write_parts(phys_writer)
+
+def save_presentation(prs, out):
+    """
+    Drop-in for prs.save(out): same parts in the same order, but static parts reuse their cached deflate
+    stream and only slides and new media are compressed. out may be a path (replaced atomically) or a
+    writable stream.
+    """
+    package = prs.part.package
+    _CachedPackageWriter.write(out, package._rels, tuple(package.iter_parts()))
+    return out
@@ -0,0 +1,190 @@
+# ppt-service/pdf_export.py
+from artifact_cache import ArtifactCache
+from metrics import observe_pdf
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import signal
+import tempfile
+import time
+
+# Long-lived headless LibreOffice instances; 0 disables PDF export
+PDF_WORKERS = max(0, int(os.getenv("PDF_WORKERS", 2)))
+SOFFICE_BIN = os.getenv("SOFFICE_BIN", "soffice")
+# Python with LibreOffice's UNO bindings (Debian: python3-uno for the system interpreter)
+PDF_UNO_PYTHON = os.getenv("PDF_UNO_PYTHON", "/usr/bin/python3")
+PDF_TIMEOUT_SECONDS = float(os.getenv("PDF_TIMEOUT_SECONDS", 120))
+PDF_START_TIMEOUT_SECONDS = float(os.getenv("PDF_START_TIMEOUT_SECONDS", 90))
+# Instances are recycled after this many conversions to keep soffice memory growth bounded
+PDF_MAX_JOBS_PER_WORKER = int(os.getenv("PDF_MAX_JOBS_PER_WORKER", 200))
+# Size budget for converted PDFs, keyed by the .pptx content hash; 0 disables the cache
+PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", 1024 * 1024 * 1024))
+
+# Bump when the export filter or its options change, so old conversions are not served
+PDF_FILTER = "impress_pdf_Export"
+
+_HELPER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdf_uno_worker.py")
+_PROFILE_ROOT = os.path.join(tempfile.gettempdir(), "ppt_pdf_profiles")
+
+class PdfUnavailable(Exception):
+    pass
+
+def content_key(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""): h.update(chunk)
+    h.update(b'\0' + PDF_FILTER.encode())
+    return h.hexdigest()
+
+class _Worker:
+    """
+    One pdf_uno_worker.py helper and the soffice instance it owns, (re)started on demand.
+    Each worker keeps its own LibreOffice profile, so instances never contend for a profile lock.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.proc = None
+        self.jobs = 0
+        self.restarts = 0
+
+    async def _start(self):
+        profile = os.path.join(_PROFILE_ROOT, f"worker{self.index}")
+        # Own session, so a timeout can kill the helper together with its soffice child
+        self.proc = await asyncio.create_subprocess_exec(
+            PDF_UNO_PYTHON, _HELPER, SOFFICE_BIN, profile, f"ppt_pdf_{os.getpid()}_{self.index}",
+            stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, start_new_session=True)
+        self.jobs = 0
+        try:
+            hello = await asyncio.wait_for(self.proc.stdout.readline(), PDF_START_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            hello = b""
+        if not hello:
+            await self.stop()
+            raise PdfUnavailable("LibreOffice worker failed to start.")
+        print(f"[PDF] Worker {self.index} up (soffice pid {json.loads(hello)['pid']})")
+
+    async def convert(self, src, dst):
+        if self.jobs >= PDF_MAX_JOBS_PER_WORKER:
+            self.restarts += 1
+            await self.stop()
+        if self.proc is None or self.proc.returncode is not None:
+            await self._start()
+        try:
+            self.proc.stdin.write(json.dumps({"src": src, "dst": dst}).encode() + b"\n")
+            await self.proc.stdin.drain()
+            line = await asyncio.wait_for(self.proc.stdout.readline(), PDF_TIMEOUT_SECONDS)
+        except (asyncio.TimeoutError, ConnectionError):
+            line = b""
+        except asyncio.CancelledError:
+            # The reply would arrive for the next caller; the instance is unusable
+            self._kill()
+            raise
+        if not line:
+            # Hung or crashed mid-document: drop the instance, the next conversion gets a fresh one
+            proc = self.proc
+            self.restarts += 1
+            self._kill()
+            await proc.wait()
+            raise RuntimeError("LibreOffice worker did not finish the conversion.")
+        self.jobs += 1
+        reply = json.loads(line)
+        if not reply.get("ok"): raise RuntimeError(reply.get("error") or "Conversion failed.")
+
+    async def stop(self):
+        proc, self.proc = self.proc, None
+        if proc is None or proc.returncode is not None: return
+        try:
+            proc.stdin.close()
+            await asyncio.wait_for(proc.wait(), 10)
+        except (asyncio.TimeoutError, ConnectionError):
+            self.proc = proc; self._kill()
+            await proc.wait()
+
+    def _kill(self):
+        proc, self.proc = self.proc, None
+        if proc is None or proc.returncode is not None: return
+        try: os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError: pass
+
+class PdfConverter:
+    """
+    PDF export through a fixed pool of headless LibreOffice workers (started on first use, reused for
+    every conversion). Results are cached by the artifact's content hash, so re-exporting an unchanged
+    deck or certificate costs a file lookup.
+    """
+
+    def __init__(self, cache_root, workers=PDF_WORKERS, cache_max_bytes=PDF_CACHE_MAX_BYTES):
+        self.cache = ArtifactCache(cache_root, cache_max_bytes, ext=".pdf")
+        self.size = workers
+        self.converted = 0
+        self.failed = 0
+        self._workers = []
+        self._idle = None
+
+    @property
+    def available(self):
+        return self.size > 0 and bool(shutil.which(SOFFICE_BIN)) and bool(shutil.which(PDF_UNO_PYTHON)) and os.path.exists(_HELPER)
+
+    def _pool(self):
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for index in range(self.size):
+                worker = _Worker(index)
+                self._workers.append(worker)
+                self._idle.put_nowait(worker)
+        return self._idle
+
+    async def convert(self, path):
+        """
+        Returns (pdf_path, cached) for the .pptx at path. When cached is False the PDF was too large for
+        (or excluded by) the cache and the caller owns, and must remove, the file.
+        """
+        start = time.perf_counter()
+        key = await asyncio.to_thread(content_key, path)
+        hit = self.cache.get(key)
+        if hit:
+            observe_pdf("cached", time.perf_counter() - start)
+            return hit, True
+        if not self.available:
+            raise PdfUnavailable("PDF export is not available (LibreOffice not installed or PDF_WORKERS=0).")
+
+        idle = self._pool()
+        worker = await idle.get()
+        scratch = tempfile.mkdtemp(prefix="ppt_pdf_")
+        dst = os.path.join(scratch, f"{key}.pdf")
+        try:
+            await worker.convert(os.path.abspath(path), dst)
+            if not os.path.exists(dst): raise RuntimeError("LibreOffice produced no PDF.")
+        except BaseException:
+            self.failed += 1
+            observe_pdf("failed", time.perf_counter() - start)
+            shutil.rmtree(scratch, ignore_errors=True)
+            raise
+        finally:
+            idle.put_nowait(worker)
+        self.converted += 1
+        observe_pdf("converted", time.perf_counter() - start)
+
+        await asyncio.to_thread(self.cache.put, key, dst)
+        stored = self.cache.get(key)
+        if stored:
+            shutil.rmtree(scratch, ignore_errors=True)
+            return stored, True
+        return dst, False
+
+    async def stop(self):
+        await asyncio.gather(*(worker.stop() for worker in self._workers), return_exceptions=True)
+
+    def stats(self):
+        return {"available": self.available, "workers": self.size, "running": sum(1 for w in self._workers if w.proc is not None),
+                "converted": self.converted, "failed": self.failed, "restarts": sum(w.restarts for w in self._workers),
+                "cache": self.cache.stats()}
+
+def release(path, cached):
+    """
+    Removes a PDF returned uncached by PdfConverter.convert (together with its scratch directory).
+    """
+    if not cached: shutil.rmtree(os.path.dirname(path), ignore_errors=True)
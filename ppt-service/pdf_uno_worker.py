@@ -0,0 +1,72 @@
+# ppt-service/pdf_uno_worker.py
+# Runs under the python that ships LibreOffice's UNO bindings (PDF_UNO_PYTHON), not the service's own,
+# so it must not import anything from this package. One helper owns one headless soffice instance.
+#
+# Protocol (one JSON object per line): the first stdout line is {"ready": true, "pid": <soffice pid>};
+# then each stdin request {"src": "/abs/in.pptx", "dst": "/abs/out.pdf"} gets {"ok": true} or
+# {"ok": false, "error": "..."}. EOF on stdin shuts soffice down.
+import json
+import subprocess
+import sys
+import time
+
+import uno
+from com.sun.star.beans import PropertyValue
+from com.sun.star.connection import NoConnectException
+
+CONNECT_TIMEOUT_SECONDS = 60
+
+def _props(**values):
+    props = []
+    for name, value in values.items():
+        prop = PropertyValue()
+        prop.Name, prop.Value = name, value
+        props.append(prop)
+    return tuple(props)
+
+def _connect(pipe, proc):
+    local = uno.getComponentContext()
+    resolver = local.ServiceManager.createInstanceWithContext("com.sun.star.bridge.UnoUrlResolver", local)
+    deadline = time.monotonic() + CONNECT_TIMEOUT_SECONDS
+    while True:
+        try:
+            ctx = resolver.resolve(f"uno:pipe,name={pipe};urp;StarOffice.ComponentContext")
+            return ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+        except NoConnectException:
+            if proc.poll() is not None: raise RuntimeError(f"soffice exited with {proc.returncode}")
+            if time.monotonic() > deadline: raise RuntimeError("soffice did not accept connections")
+            time.sleep(0.25)
+
+def _convert(desktop, src, dst):
+    doc = desktop.loadComponentFromURL(uno.systemPathToFileUrl(src), "_blank", 0, _props(Hidden=True, ReadOnly=True))
+    if doc is None: raise RuntimeError(f"LibreOffice could not open {src}")
+    try:
+        doc.storeToURL(uno.systemPathToFileUrl(dst), _props(FilterName="impress_pdf_Export"))
+    finally:
+        doc.close(True)
+
+def main():
+    soffice, profile, pipe = sys.argv[1:4]
+    proc = subprocess.Popen([soffice, "--headless", "--invisible", "--nologo", "--norestore", "--nodefault", "--nolockcheck",
+                             f"-env:UserInstallation={uno.systemPathToFileUrl(profile)}",
+                             f"--accept=pipe,name={pipe};urp;StarOffice.ComponentContext"],
+                            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        desktop = _connect(pipe, proc)
+        print(json.dumps({"ready": True, "pid": proc.pid}), flush=True)
+        for line in sys.stdin:
+            try:
+                request = json.loads(line)
+                _convert(desktop, request["src"], request["dst"])
+                reply = {"ok": True}
+            except Exception as e:
+                reply = {"ok": False, "error": str(e)}
+            print(json.dumps(reply), flush=True)
+        try: desktop.terminate()
+        except Exception: pass
+        proc.wait(timeout=10)
+    finally:
+        if proc.poll() is None: proc.kill()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+# ppt-service/render_pool.py
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from synthesis_logic import polish_content
+from generator import create_pptx
+from expert_synthesis import create_expert_deck
+from certificate_engine import create_certificate, create_certificate_bundle
+from image_fetch import drain_fetch_log
+from metrics import observe_render, track_render_queue
+import warmup
+from io import BytesIO
+import asyncio
+import json
+import multiprocessing
+import os
+import threading
+import time
+import traceback
+
+# Worker processes for CPU-bound synthesis (python-pptx/lxml work holds the GIL)
+RENDER_WORKERS = max(1, int(os.getenv("RENDER_WORKERS", os.cpu_count() or 1)))
+# fork lets workers inherit the API process's warmed caches; spawn/forkserver workers warm themselves
+RENDER_START_METHOD = os.getenv("RENDER_START_METHOD", "fork")
+PRESTART_TIMEOUT_SECONDS = float(os.getenv("PRESTART_TIMEOUT_SECONDS", 60))
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# Progress channel: workers post (event, job_id, ...) tuples, the API process drains them (see jobs.py)
+_progress_queue = None
+_worker_progress = None
+
+# Rendezvous that keeps every prestart task busy until all RENDER_WORKERS processes exist (see prestart)
+_barrier = None
+_worker_barrier = None
+
+# Fetch outcomes that put the actual picture on the slide ("stale": the last good copy while its host is down)
+_IMAGE_DELIVERED = ("network", "cache", "stale")
+
+# Renders handed to the pool and not finished yet (touched on the event loop only)
+_pending = 0
+track_render_queue(lambda: _pending, RENDER_WORKERS)
+
+# Measurements of the task currently running in this worker (see _instrumented)
+_report = None
+
+def _mp_context():
+    if RENDER_START_METHOD in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context(RENDER_START_METHOD)
+    return multiprocessing.get_context()
+
+def _init_worker(queue, barrier):
+    global _worker_progress, _worker_barrier
+    _worker_progress = queue
+    _worker_barrier = barrier
+    # Forked workers inherit a warm parent; spawned ones (or a pool rebuilt before warm-up) catch up here
+    if warmup.WARMUP_ON_START and not warmup.WARM:
+        try: warmup.warm_up()
+        except Exception as e: print(f"[WARMUP] Worker warm-up failed: {e}")
+
+def get_progress_queue():
+    get_executor()
+    return _progress_queue
+
+def get_executor():
+    """
+    Lazily boots the shared worker pool. Each worker keeps its own template caches warm.
+    """
+    global _executor, _progress_queue, _barrier
+    with _executor_lock:
+        ctx = _mp_context()
+        if _progress_queue is None:
+            _progress_queue = ctx.Queue()
+            _barrier = ctx.Barrier(RENDER_WORKERS)
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=RENDER_WORKERS, mp_context=ctx, initializer=_init_worker, initargs=(_progress_queue, _barrier))
+        return _executor
+
+def prestart():
+    """
+    Forks all RENDER_WORKERS processes now instead of on first use. Call after warmup.warm_up() so the
+    workers start with everything already imported and cached. Returns the number of live workers.
+    """
+    executor = get_executor()
+    futures = [executor.submit(_prestarted) for _ in range(RENDER_WORKERS)]
+    pids = {f.result() for f in futures}
+    _barrier.reset()
+    return len(pids)
+
+async def run_in_pool(fn, *args, report=None):
+    """
+    Awaitable hand-off to the pool so the event loop stays free while a worker renders.
+    The worker's per-stage timings travel back with the result and are recorded in metrics
+    (and copied into report, when given, see complete_render).
+    """
+    global _pending
+    loop = asyncio.get_running_loop()
+    executor = get_executor()
+    _pending += 1
+    try:
+        result, measured = await loop.run_in_executor(executor, _instrumented, fn, *args)
+    except BrokenProcessPool:
+        # A worker died (OOM/segfault): drop the broken pool so the next request gets a fresh one
+        _discard(executor)
+        observe_render(fn.__name__, None, "crashed")
+        raise
+    except Exception as e:
+        observe_render(fn.__name__, getattr(e, "render_report", None), "error")
+        raise
+    finally:
+        _pending -= 1
+    observe_render(fn.__name__, measured, "error" if isinstance(result, dict) and result.get("success") is False else "ok")
+    if report is not None: report.update(measured)
+    return result
+
+def complete_render(report):
+    """
+    False when an evidence image could not be fetched and the deck carries a placeholder in its place.
+    Such a deck is served but never cached, so the next identical request fetches again.
+    """
+    return all(image_outcome in _IMAGE_DELIVERED for image_outcome, _ in report.get("images", ()))
+
+def _discard(executor):
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+def shutdown():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True, cancel_futures=True)
+            _executor = None
+
+# --- WORKER ENTRYPOINTS (must stay module-level for pickling) ---
+
+def _prestarted():
+    # Blocking here makes the pool spawn a fresh process for every remaining prestart task
+    try: _worker_barrier.wait(PRESTART_TIMEOUT_SECONDS)
+    except threading.BrokenBarrierError: pass
+    return os.getpid()
+
+def _instrumented(fn, *args):
+    """
+    Runs fn in the worker and returns (result, report): wall time, engine, stage timings and image fetches.
+    On failure the report rides along on the exception as render_report.
+    """
+    global _report
+    _report = report = {"engine": "none", "stages": {}}
+    drain_fetch_log()
+    start = time.perf_counter()
+    try:
+        return fn(*args), report
+    except Exception as e:
+        e.render_report = report
+        raise
+    finally:
+        report["seconds"] = time.perf_counter() - start
+        report["images"] = drain_fetch_log()
+        _report = None
+
+def _stage_sink(engine):
+    """
+    Stage-timings dict of the task being measured (None outside _instrumented, which disables timing).
+    """
+    if _report is None: return None
+    _report["engine"] = engine
+    return _report["stages"]
+
+def render_deck(team_name, college_name, payload, on_progress=None, out=None):
+    """
+    Renders a pitch deck inside a worker: expert payloads get the 18-slide deck, anything else the legacy one.
+    Returns the artifact path (or out, when given); exceptions propagate back to the awaiting request.
+    """
+    # Logic Branching
+    is_expert = False
+    if isinstance(payload, dict) and 'projectName' in payload:
+        is_expert = True
+    elif isinstance(payload, str) and 'projectName' in payload:
+        is_expert = True
+
+    if is_expert:
+        if isinstance(payload, str):
+            try:
+                payload = json.loads(payload)
+            except:
+                pass
+        return create_expert_deck(team_name, college_name, payload, on_progress=on_progress, out=out, timings=_stage_sink("expert"))
+
+    timings = _stage_sink("basic")
+    start = time.perf_counter()
+    processed = polish_content(payload)
+    if timings is not None: timings["polish"] = time.perf_counter() - start
+    return create_pptx(team_name, college_name, processed, out=out, timings=timings)
+
+def render_deck_bytes(team_name, college_name, payload):
+    """
+    Streaming variant: serializes into memory and ships the .pptx bytes back, with no disk round-trip.
+    """
+    buf = BytesIO()
+    render_deck(team_name, college_name, payload, out=buf)
+    return buf.getvalue()
+
+def render_deck_job(job_id, team_name, college_name, payload):
+    """
+    Job-API variant of render_deck: reports 'running' and per-slide progress over the progress channel.
+    """
+    def report(kind, *args):
+        if _worker_progress is not None:
+            _worker_progress.put((kind, job_id) + args)
+    report("running")
+    return render_deck(team_name, college_name, payload, on_progress=lambda done, total, title: report("progress", done, total, title))
+
+def render_certificate(job):
+    """
+    Renders one certificate inside a worker. Never raises: failures are reported per participant.
+    """
+    try:
+        out_path = job['out_path']
+        create_certificate(job['name'], job['college'], job['year'], job['dept'], job['role'],
+                           event_name=job['event_name'], submission_date=job['submission_date'],
+                           out_path=out_path, use_template=job['use_template'], timings=_stage_sink("certificate"))
+        if not os.path.exists(out_path):
+            raise Exception("Synthesis failed to serialize artifact.")
+        return {"name": job['name'], "success": True, "file_url": os.path.basename(out_path)}
+    except Exception as e:
+        traceback.print_exc()
+        return {"name": job.get('name'), "success": False, "error": str(e)}
+
+def render_certificate_bytes(job):
+    """
+    Streaming variant of render_certificate: returns the .pptx bytes; errors propagate.
+    """
+    buf = BytesIO()
+    create_certificate(job['name'], job['college'], job['year'], job['dept'], job['role'],
+                       event_name=job['event_name'], submission_date=job['submission_date'],
+                       out_path=buf, use_template=job['use_template'], timings=_stage_sink("certificate"))
+    return buf.getvalue()
+
+def render_certificate_bundle(jobs, out_path):
+    """
+    Renders a whole batch into one presentation, one slide per participant. Never raises.
+    """
+    try:
+        create_certificate_bundle(jobs, out_path, timings=_stage_sink("certificate_bundle"))
+        if not os.path.exists(out_path):
+            raise Exception("Synthesis failed to serialize artifact.")
+        return {"success": True, "count": len(jobs), "file_url": os.path.basename(out_path)}
+    except Exception as e:
+        traceback.print_exc()
+        return {"success": False, "error": str(e)}
+
+def render_certificate_bundle_bytes(jobs):
+    """
+    Streaming variant of render_certificate_bundle: returns the .pptx bytes; errors propagate.
+    """
+    buf = BytesIO()
+    create_certificate_bundle(jobs, buf, timings=_stage_sink("certificate_bundle"))
+    return buf.getvalue()
@@ -0,0 +1,120 @@
+# ppt-service/retention.py
+import os
+import threading
+import time
+
+# Vault retention: 0 disables the corresponding rule
+VAULT_TTL_SECONDS = int(os.getenv("VAULT_TTL_SECONDS", 7 * 24 * 3600))
+VAULT_MAX_BYTES = int(os.getenv("VAULT_MAX_BYTES", 2 * 1024 * 1024 * 1024))
+VAULT_SWEEP_SECONDS = int(os.getenv("VAULT_SWEEP_SECONDS", 300))
+# Freshly written files are never size-evicted, so a client always gets a chance to download them
+VAULT_MIN_AGE_SECONDS = int(os.getenv("VAULT_MIN_AGE_SECONDS", 600))
+
+class RetentionManager:
+    """
+    Background sweeper for the output vaults. Files idle (since their last download, or creation)
+    for longer than the TTL are removed; above the byte cap, files are evicted least-recently-downloaded
+    first, with artifacts already synced elsewhere going before anything else.
+    """
+
+    def __init__(self, index, ttl=VAULT_TTL_SECONDS, max_bytes=VAULT_MAX_BYTES,
+                 interval=VAULT_SWEEP_SECONDS, min_age=VAULT_MIN_AGE_SECONDS):
+        self.index = index
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.min_age = min_age
+        self.sweeps = 0
+        self.expired = 0
+        self.evicted = 0
+        self.freed_bytes = 0
+        self.last_sweep = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        if self._thread or self.interval <= 0 or not (self.ttl or self.max_bytes): return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="vault-retention", daemon=True)
+        self._thread.start()
+        print(f"[RETENTION] Sweeping every {self.interval}s (ttl={self.ttl}s, max_bytes={self.max_bytes})")
+
+    def stop(self):
+        self._stop.set()
+        if self._thread: self._thread.join(timeout=5)
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"[RETENTION] Sweep failed: {e}")
+
+    def touch(self, kind, filename):
+        """
+        Records a download; eviction is ordered by this timestamp.
+        """
+        self.index.mark(kind, filename, last_access=time.time())
+
+    def sweep(self, now=None):
+        """
+        One retention pass over every vault. Returns the number of files removed.
+        """
+        with self._lock:
+            now = now or time.time()
+            candidates = [(kind, meta) for kind in self.index.vaults for meta in self.index.entries(kind)]
+            removed = 0
+
+            if self.ttl:
+                for kind, meta in candidates:
+                    if now - self._last_used(meta) > self.ttl and self._remove(kind, meta):
+                        self.expired += 1; removed += 1
+                candidates = [(kind, meta) for kind, meta in candidates if self.index.get(kind, meta["filename"])]
+
+            if self.max_bytes and self.index.total_bytes() > self.max_bytes:
+                evictable = [(kind, meta) for kind, meta in candidates if now - meta["created"] >= self.min_age]
+                # Synced artifacts first, then least recently downloaded
+                evictable.sort(key=lambda item: (not item[1]["synced"], self._last_used(item[1])))
+                for kind, meta in evictable:
+                    if self.index.total_bytes() <= self.max_bytes: break
+                    if self._remove(kind, meta):
+                        self.evicted += 1; removed += 1
+
+            self.sweeps += 1
+            self.last_sweep = now
+            if removed: print(f"[RETENTION] Removed {removed} artifact(s); vaults now {self.index.total_bytes()} bytes")
+            return removed
+
+    @staticmethod
+    def _last_used(meta):
+        return meta["last_access"] or meta["created"]
+
+    def _remove(self, kind, meta):
+        # The pass works from a snapshot: an artifact re-published or downloaded since then is no longer a candidate
+        current = self.index.get(kind, meta["filename"])
+        if current is None or (current["created"], current["last_access"]) != (meta["created"], meta["last_access"]):
+            return False
+        try:
+            os.remove(self.index.path(kind, meta["filename"]))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"[RETENTION] Could not remove {meta['filename']}: {e}")
+            return False
+        self.index.remove(kind, meta["filename"])
+        self.freed_bytes += meta["size"]
+        return True
+
+    def stats(self):
+        return {
+            "ttl_seconds": self.ttl,
+            "max_bytes": self.max_bytes,
+            "vault_bytes": self.index.total_bytes(),
+            "sweeps": self.sweeps,
+            "expired": self.expired,
+            "evicted": self.evicted,
+            "freed_bytes": self.freed_bytes,
+            "last_sweep": self.last_sweep
+        }
@@ -0,0 +1,117 @@
+# ppt-service/schemas.py
+from typing import Any, List, Optional
+from fastapi import HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, model_validator
+import json
+import os
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    # Same results, just slower on large bodies
+    _loads = json.loads
+
+# Largest accepted request body; bigger ones get 413 before they are parsed, let alone rendered
+MAX_PAYLOAD_BYTES = int(os.getenv("MAX_PAYLOAD_BYTES", 2 * 1024 * 1024))
+
+class _Body(BaseModel):
+    # Unknown keys are ignored, numbers are accepted for text fields and a null counts as "not given"
+    model_config = ConfigDict(extra="ignore", coerce_numbers_to_str=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _drop_nulls(cls, data):
+        return {k: v for k, v in data.items() if v is not None} if isinstance(data, dict) else data
+
+def decode_json(text):
+    """
+    Decodes a double-encoded (JSON-in-a-string) value; anything that is not a JSON object or array is returned as is.
+    """
+    if isinstance(text, str) and text.lstrip()[:1] in ("{", "["):
+        try: return _loads(text)
+        except ValueError: pass
+    return text
+
+class DeckRequest(_Body):
+    """
+    /generate-artifact, /generate-expert-pitch and their /jobs twins. The deck travels as 'content' or
+    'project_data' (the backend sends both, usually the same body), as an object or as a JSON string.
+    """
+    team_name: str = "Unnamed_Team"
+    college_name: str = "Institution"
+    content: Any = None
+    project_data: Any = None
+    no_cache: bool = False
+    _payload: Any = PrivateAttr(None)
+
+    @model_validator(mode="after")
+    def _decode_payload(self):
+        # Only the field actually used is looked at, and a JSON string is decoded here, once
+        self._payload = decode_json(self.content or self.project_data)
+        return self
+
+    @property
+    def payload(self):
+        return self._payload
+
+class CertificateRequest(_Body):
+    """
+    One participant: the /generate-certificate body, and each record of a batch.
+    """
+    name: str = "Participant"
+    college: str = "Institution"
+    year: str = "N/A"
+    dept: str = "N/A"
+    role: str = "MEMBER"
+    event_name: Optional[str] = None
+    submission_date: Optional[str] = None
+    team_name: Optional[str] = None
+
+class CertificateBatchRequest(_Body):
+    """
+    /generate-certificates/batch. Records stay untyped here so one malformed participant fails alone
+    (see CertificateBatchRequest.records) instead of rejecting the whole batch.
+    """
+    participants: Optional[List[Any]] = None
+    event_name: Optional[str] = None
+    submission_date: Optional[str] = None
+    team_name: Optional[str] = None
+    bundle: bool = False
+    bundle_name: Optional[str] = None
+
+    def records(self):
+        """
+        Validated participants, with None in place of each record that is not a valid participant object.
+        """
+        records = []
+        for p in self.participants or ():
+            try: records.append(CertificateRequest.model_validate(p) if isinstance(p, dict) else None)
+            except ValidationError: records.append(None)
+        return records
+
+async def read_body(request: Request, model):
+    """
+    Reads a JSON request body into model: refused with 413 past MAX_PAYLOAD_BYTES (on the declared
+    Content-Length when there is one, so an oversized upload is not even read), decoded exactly once,
+    validated (422 like any FastAPI body).
+    """
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > MAX_PAYLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"Payload exceeds {MAX_PAYLOAD_BYTES} bytes.")
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > MAX_PAYLOAD_BYTES:
+            raise HTTPException(status_code=413, detail=f"Payload exceeds {MAX_PAYLOAD_BYTES} bytes.")
+    try:
+        data = _loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Malformed JSON body.")
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON object.")
+    try:
+        return model.model_validate(data)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False), body=data)
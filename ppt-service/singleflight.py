@@ -0,0 +1,75 @@
+# ppt-service/singleflight.py
+from collections import OrderedDict
+import asyncio
+import os
+import time
+
+# How long a finished result stays replayable under its Idempotency-Key; 0 keeps only in-flight sharing
+IDEMPOTENCY_TTL_SECONDS = float(os.getenv("IDEMPOTENCY_TTL_SECONDS", 600))
+
+class IdempotencyConflict(Exception):
+    """
+    An Idempotency-Key reused with a different request body than the one it was first sent with.
+    """
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent work: the first caller for a key starts it, later callers await the same
+    task and get the same result (or exception). A caller that disconnects does not cancel the shared work.
+    Lives on the event loop, like the job registry.
+    """
+
+    def __init__(self, ttl=IDEMPOTENCY_TTL_SECONDS):
+        self.ttl = ttl
+        self.started = 0
+        self.shared = 0
+        self.replayed = 0
+        self._flights = {}  # key -> (task, fingerprint)
+        self._done = OrderedDict()  # key -> (expires, fingerprint, result), oldest first
+
+    async def run(self, key, fn, remember=False, fingerprint=None):
+        """
+        Awaits fn() (a coroutine function) once per key in flight. With remember, a successful result is also
+        replayed to callers with the same key for the next ttl seconds (idempotent retries). fingerprint
+        identifies the request body behind a client-chosen key: joining or replaying under the same key with
+        a different one raises IdempotencyConflict.
+        """
+        self._expire()
+        if key in self._done:
+            _, first, result = self._done[key]
+            check_fingerprint(first, fingerprint)
+            self.replayed += 1
+            return result
+        flight = self._flights.get(key)
+        if flight is None:
+            task = asyncio.ensure_future(fn())
+            self._flights[key] = (task, fingerprint)
+            self.started += 1
+            task.add_done_callback(lambda t: self._finish(key, t, remember, fingerprint))
+        else:
+            task, first = flight
+            check_fingerprint(first, fingerprint)
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key, task, remember, fingerprint):
+        self._flights.pop(key, None)
+        if task.cancelled() or task.exception() is not None: return
+        if remember and self.ttl > 0:
+            self._done[key] = (time.monotonic() + self.ttl, fingerprint, task.result())
+
+    def _expire(self):
+        now = time.monotonic()
+        while self._done and next(iter(self._done.values()))[0] <= now:
+            self._done.popitem(last=False)
+
+    def stats(self):
+        return {"in_flight": len(self._flights), "started": self.started, "shared": self.shared,
+                "replayed": self.replayed, "remembered": len(self._done)}
+
+def check_fingerprint(first, fingerprint):
+    """
+    Raises IdempotencyConflict unless fingerprint matches the one first recorded under the same key.
+    """
+    if first != fingerprint:
+        raise IdempotencyConflict("Idempotency-Key was already used with a different request body.")
@@ -0,0 +1,230 @@
+# ppt-service/slide_emitter.py
+from pptx.enum.dml import MSO_LINE_DASH_STYLE
+from pptx.enum.shapes import MSO_CONNECTOR, MSO_SHAPE
+from pptx.enum.text import PP_ALIGN
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+import os
+import re
+
+# Direct-XML backend for the deck drawers; 0 falls back to building every shape through python-pptx
+DIRECT_XML = os.getenv("DIRECT_XML", "1") != "0"
+
+NO_FILL = "none"
+
+_AUTOSHAPES = {"rect": (MSO_SHAPE.RECTANGLE, "Rectangle"), "ellipse": (MSO_SHAPE.OVAL, "Oval")}
+_NS = nsdecls("a", "p", "r")
+_STYLE = ('<a:lnRef idx="%s"><a:schemeClr val="accent1"/></a:lnRef><a:fillRef idx="%s"><a:schemeClr val="accent1"/></a:fillRef>'
+          '<a:effectRef idx="%s"><a:schemeClr val="accent1"/></a:effectRef><a:fontRef idx="minor"><a:schemeClr val="%s"/></a:fontRef>')
+_SHAPE_STYLE = "<p:style>" + _STYLE % (1, 3, 2, "lt1") + "</p:style>"
+_CXN_STYLE = "<p:style>" + _STYLE % (2, 0, 1, "tx1") + "</p:style>"
+_TABLE_STYLE = "{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}"
+_CTRL_CHARS = re.compile(r"([\x00-\x08\x0B-\x1F])")
+
+class SlideCanvas:
+    """
+    Declarative drawing surface for one slide. Drawers describe shapes (boxes, text boxes, connectors,
+    tables); flush() turns everything pending into slide XML in a single parse, producing exactly the
+    elements python-pptx would have built call by call. Anything that needs the python-pptx object model
+    (pictures, relationships) goes through .shapes / direct(), which flushes first so z-order holds.
+    """
+
+    def __init__(self, slide, direct_xml=DIRECT_XML):
+        self.slide = slide
+        self.direct_xml = direct_xml
+        self._pending = []
+        self._next_id = None
+
+    # -- shape descriptions (all positions/sizes are EMU lengths) --
+
+    def shape(self, prst, x, y, w, h, fill=None, line=None, line_width=None, shadow=True, text=None, wrap=False):
+        """
+        Auto shape ("rect" or "ellipse"). fill: None (theme), NO_FILL or an RGBColor; line_width 0 hides
+        the outline; text is (text, size_pt, bold, color) for the first paragraph.
+        """
+        self._pending.append(("shape", prst, x, y, w, h, fill, line, line_width, shadow, text, wrap))
+
+    def textbox(self, x, y, w, h, text, size, bold=None, color=None, align=None, font=None, shadow=True):
+        self._pending.append(("textbox", x, y, w, h, text, size, bold, color, align, font, shadow))
+
+    def connector(self, x1, y1, x2, y2, color, width=None, dash=None):
+        self._pending.append(("connector", x1, y1, x2, y2, color, width, dash))
+
+    def table(self, x, y, w, h, rows):
+        """
+        rows: list of rows of (text, fill, font) cells; text None leaves the cell empty, fill None keeps
+        the table style, font is (size_pt, bold, color) applied to the first paragraph or None.
+        """
+        self._pending.append(("table", x, y, w, h, rows))
+
+    # -- object-model access --
+
+    def direct(self):
+        """
+        Flushes pending shapes and hands back the python-pptx slide for anything not described here.
+        """
+        self.flush()
+        self._next_id = None
+        return self.slide
+
+    @property
+    def shapes(self):
+        return self.direct().shapes
+
+    def flush(self):
+        if not self._pending: return
+        pending, self._pending = self._pending, []
+        if not self.direct_xml:
+            for spec in pending: _BUILDERS[spec[0]](self.slide.shapes, *spec[1:])
+            return
+        spTree = self.slide.shapes._spTree
+        if self._next_id is None: self._next_id = spTree.max_shape_id + 1
+        parts = []
+        for spec in pending:
+            parts.append(_EMITTERS[spec[0]](self._next_id, *spec[1:]))
+            self._next_id += 1
+        fragment = parse_xml(f"<p:spTree {_NS}>{''.join(parts)}</p:spTree>")
+        for el in list(fragment):
+            spTree.insert_element_before(el, "p:extLst")
+
+# --- XML emitters (one string per shape, mirroring python-pptx's templates and setters) ---
+
+def _esc(text):
+    text = _CTRL_CHARS.sub(lambda m: "_x%04X_" % ord(m.group(1)), text)
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+def _text(value):
+    return "" if value is None else str(value)
+
+def _runs(text):
+    # _Paragraph.text: '\n' and '\v' become line breaks, empty runs are dropped
+    out = []
+    for i, chunk in enumerate(re.split("\n|\v", text)):
+        if i: out.append("<a:br/>")
+        if chunk: out.append(f"<a:r><a:t>{_esc(chunk)}</a:t></a:r>")
+    return "".join(out)
+
+def _solid(color):
+    return f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+
+def _defRPr(size, bold=None, color=None, font=None):
+    attrs = f' sz="{size.centipoints}"'
+    if bold is not None: attrs += f' b="{int(bool(bold))}"'
+    children = (_solid(color) if color is not None else "") + (f'<a:latin typeface="{_esc(font)}"/>' if font else "")
+    return f"<a:defRPr{attrs}>{children}</a:defRPr>" if children else f"<a:defRPr{attrs}/>"
+
+def _xfrm(x, y, w, h, flip=""):
+    return f'<a:xfrm{flip}><a:off x="{x}" y="{y}"/><a:ext cx="{w}" cy="{h}"/></a:xfrm>'
+
+def _fill(fill):
+    if fill is None: return ""
+    return "<a:noFill/>" if fill == NO_FILL else _solid(fill)
+
+def _ln(color, width):
+    if color is None and width is None: return ""
+    w = f' w="{width}"' if width else ""
+    return f"<a:ln{w}>{_solid(color)}</a:ln>" if color is not None else f"<a:ln{w}/>"
+
+def _emit_shape(id_, prst, x, y, w, h, fill, line, line_width, shadow, text, wrap):
+    name = f"{_AUTOSHAPES[prst][1]} {id_ - 1}"
+    effect = "" if shadow else "<a:effectLst/>"
+    body = '<a:bodyPr rtlCol="0" anchor="ctr" wrap="square"/>' if wrap else '<a:bodyPr rtlCol="0" anchor="ctr"/>'
+    if text is None:
+        para = '<a:p><a:pPr algn="ctr"/></a:p>'
+    else:
+        value, size, bold, color = text
+        para = f'<a:p><a:pPr algn="ctr">{_defRPr(size, bold, color)}</a:pPr>{_runs(_text(value))}</a:p>'
+    return (f'<p:sp><p:nvSpPr><p:cNvPr id="{id_}" name="{name}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+            f'<p:spPr>{_xfrm(x, y, w, h)}<a:prstGeom prst="{prst}"><a:avLst/></a:prstGeom>{_fill(fill)}{_ln(line, line_width)}{effect}</p:spPr>'
+            f'{_SHAPE_STYLE}<p:txBody>{body}<a:lstStyle/>{para}</p:txBody></p:sp>')
+
+def _emit_textbox(id_, x, y, w, h, text, size, bold, color, align, font, shadow):
+    effect = "" if shadow else "<a:effectLst/>"
+    algn = f' algn="{PP_ALIGN.to_xml(align)}"' if align is not None else ""
+    return (f'<p:sp><p:nvSpPr><p:cNvPr id="{id_}" name="TextBox {id_ - 1}"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+            f'<p:spPr>{_xfrm(x, y, w, h)}<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/>{effect}</p:spPr>'
+            f'<p:txBody><a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+            f'<a:p><a:pPr{algn}>{_defRPr(size, bold, color, font)}</a:pPr>{_runs(_text(text))}</a:p></p:txBody></p:sp>')
+
+def _emit_connector(id_, x1, y1, x2, y2, color, width, dash):
+    flip = (' flipH="1"' if x1 > x2 else "") + (' flipV="1"' if y1 > y2 else "")
+    w = f' w="{width}"' if width else ""
+    dash_xml = f'<a:prstDash val="{MSO_LINE_DASH_STYLE.to_xml(dash)}"/>' if dash is not None else ""
+    return (f'<p:cxnSp><p:nvCxnSpPr><p:cNvPr id="{id_}" name="Connector {id_ - 1}"/><p:cNvCxnSpPr/><p:nvPr/></p:nvCxnSpPr>'
+            f'<p:spPr>{_xfrm(min(x1, x2), min(y1, y2), abs(x2 - x1), abs(y2 - y1), flip)}<a:prstGeom prst="line"><a:avLst/></a:prstGeom>'
+            f'<a:ln{w}>{_solid(color)}{dash_xml}</a:ln></p:spPr>{_CXN_STYLE}</p:cxnSp>')
+
+def _emit_cell(text, fill, font):
+    # TextFrame.text: '\n' starts a new paragraph; the font lands on the first one
+    paras = _text(text).split("\n") if text is not None else [""]
+    out = []
+    for i, chunk in enumerate(paras):
+        ppr = f"<a:pPr>{_defRPr(*font)}</a:pPr>" if font is not None and i == 0 else ""
+        runs = _runs(chunk)
+        out.append(f"<a:p>{ppr}{runs}</a:p>" if ppr or runs else "<a:p/>")
+    tcPr = f"<a:tcPr>{_solid(fill)}</a:tcPr>" if fill is not None else "<a:tcPr/>"
+    return f"<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>{''.join(out)}</a:txBody>{tcPr}</a:tc>"
+
+def _emit_table(id_, x, y, w, h, rows):
+    n_rows, n_cols = len(rows), len(rows[0])
+    col_w, row_h = w // n_cols, h // n_rows
+    grid = "".join(f'<a:gridCol w="{col_w if c < n_cols - 1 else w - (n_cols - 1) * col_w}"/>' for c in range(n_cols))
+    trs = "".join(
+        f'<a:tr h="{row_h if r < n_rows - 1 else h - (n_rows - 1) * row_h}">' + "".join(_emit_cell(*cell) for cell in row) + "</a:tr>"
+        for r, row in enumerate(rows))
+    return (f'<p:graphicFrame><p:nvGraphicFramePr><p:cNvPr id="{id_}" name="Table {id_ - 1}"/>'
+            f'<p:cNvGraphicFramePr><a:graphicFrameLocks noGrp="1"/></p:cNvGraphicFramePr><p:nvPr/></p:nvGraphicFramePr>'
+            f'<p:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{w}" cy="{h}"/></p:xfrm>'
+            f'<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/table">'
+            f'<a:tbl><a:tblPr firstRow="1" bandRow="1"><a:tableStyleId>{_TABLE_STYLE}</a:tableStyleId></a:tblPr>'
+            f'<a:tblGrid>{grid}</a:tblGrid>{trs}</a:tbl></a:graphicData></a:graphic></p:graphicFrame>')
+
+_EMITTERS = {"shape": _emit_shape, "textbox": _emit_textbox, "connector": _emit_connector, "table": _emit_table}
+
+# --- python-pptx builders (reference implementation, used when DIRECT_XML=0) ---
+
+def _apply_font(font, size, bold=None, color=None, name=None):
+    font.size = size
+    if bold is not None: font.bold = bold
+    if name: font.name = name
+    if color is not None: font.color.rgb = color
+
+def _build_shape(shapes, prst, x, y, w, h, fill, line, line_width, shadow, text, wrap):
+    sh = shapes.add_shape(_AUTOSHAPES[prst][0], x, y, w, h)
+    if not shadow: sh.shadow.inherit = False
+    if fill == NO_FILL:
+        sh.fill.background()
+    elif fill is not None:
+        sh.fill.solid(); sh.fill.fore_color.rgb = fill
+    if line is not None: sh.line.color.rgb = line
+    if line_width is not None: sh.line.width = line_width
+    if wrap: sh.text_frame.word_wrap = True
+    if text is not None:
+        value, size, bold, color = text
+        p = sh.text_frame.paragraphs[0]; p.text = _text(value)
+        _apply_font(p.font, size, bold, color)
+
+def _build_textbox(shapes, x, y, w, h, text, size, bold, color, align, font, shadow):
+    tx = shapes.add_textbox(x, y, w, h)
+    if not shadow: tx.shadow.inherit = False
+    p = tx.text_frame.paragraphs[0]; p.text = _text(text)
+    _apply_font(p.font, size, bold, color, font)
+    if align is not None: p.alignment = align
+
+def _build_connector(shapes, x1, y1, x2, y2, color, width, dash):
+    c = shapes.add_connector(MSO_CONNECTOR.STRAIGHT, x1, y1, x2, y2)
+    c.line.color.rgb = color
+    if width is not None: c.line.width = width
+    if dash is not None: c.line.dash_style = dash
+
+def _build_table(shapes, x, y, w, h, rows):
+    table = shapes.add_table(len(rows), len(rows[0]), x, y, w, h).table
+    for r, row in enumerate(rows):
+        for c, (text, fill, font) in enumerate(row):
+            cell = table.cell(r, c)
+            if text is not None: cell.text = _text(text)
+            if fill is not None:
+                cell.fill.solid(); cell.fill.fore_color.rgb = fill
+            if font is not None: _apply_font(cell.text_frame.paragraphs[0].font, *font)
+
+_BUILDERS = {"shape": _build_shape, "textbox": _build_textbox, "connector": _build_connector, "table": _build_table}
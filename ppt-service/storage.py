@@ -0,0 +1,87 @@
+# ppt-service/storage.py
+from atomic_files import write_atomic
+import os
+
+# Where finished artifacts are published: "local" (service vaults) or "s3" (any S3-compatible endpoint)
+ARTIFACT_STORAGE = os.getenv("ARTIFACT_STORAGE", "local").lower()
+
+PPTX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+class LocalStorage:
+    """
+    Local-filesystem driver: artifacts stay in the service vaults and are served by /outputs and /certs.
+    """
+    name = "local"
+    remote = False
+
+    def __init__(self, roots, routes):
+        self.roots = roots    # kind -> directory
+        self.routes = routes  # kind -> URL path prefix
+
+    def put(self, kind, filename, src):
+        """
+        Publishes src (a file path or bytes) as kind/filename. Returns the artifact's location.
+        """
+        dest = os.path.join(self.roots[kind], filename)
+        if isinstance(src, bytes) or os.path.abspath(src) != os.path.abspath(dest):
+            write_atomic(dest, src)
+        return self.location(kind, filename)
+
+    def location(self, kind, filename):
+        return f"{self.routes[kind]}/{filename}"
+
+class S3Storage:
+    """
+    S3-compatible driver (AWS, MinIO, R2, a local moto server...). Artifacts are uploaded as soon as they
+    are rendered and the endpoints return the object URL instead of a vault file name to pull.
+    """
+    name = "s3"
+    remote = True
+
+    def __init__(self, bucket, endpoint_url=None, region=None, prefix="", public_base_url=None):
+        try:
+            import boto3
+        except ImportError:
+            raise RuntimeError("ARTIFACT_STORAGE=s3 requires boto3 (pip install boto3)")
+        self.bucket = bucket
+        self.endpoint_url = endpoint_url
+        self.prefix = prefix.strip('/') + '/' if prefix.strip('/') else ''
+        self.public_base_url = (public_base_url or '').rstrip('/')
+        # Credentials follow the standard AWS chain (AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY, profiles, roles)
+        self._client = boto3.client("s3", endpoint_url=endpoint_url, region_name=region)
+
+    def key(self, kind, filename):
+        return f"{self.prefix}{kind}/{filename}"
+
+    def put(self, kind, filename, src):
+        key = self.key(kind, filename)
+        extra = {"ContentType": PPTX_MEDIA_TYPE}
+        if isinstance(src, bytes):
+            self._client.put_object(Bucket=self.bucket, Key=key, Body=src, **extra)
+        else:
+            self._client.upload_file(src, self.bucket, key, ExtraArgs=extra)
+        return self.location(kind, filename)
+
+    def location(self, kind, filename):
+        key = self.key(kind, filename)
+        if self.public_base_url:
+            return f"{self.public_base_url}/{key}"
+        if self.endpoint_url:
+            return f"{self.endpoint_url.rstrip('/')}/{self.bucket}/{key}"
+        return f"https://{self.bucket}.s3.amazonaws.com/{key}"
+
+def create_storage(roots, routes):
+    """
+    Builds the driver selected by ARTIFACT_STORAGE; S3 settings come from S3_* environment variables.
+    """
+    if ARTIFACT_STORAGE == "s3":
+        bucket = os.getenv("S3_BUCKET")
+        if not bucket: raise RuntimeError("ARTIFACT_STORAGE=s3 requires S3_BUCKET")
+        return S3Storage(
+            bucket,
+            endpoint_url=os.getenv("S3_ENDPOINT_URL") or None,
+            region=os.getenv("S3_REGION") or None,
+            prefix=os.getenv("S3_PREFIX", ""),
+            public_base_url=os.getenv("S3_PUBLIC_BASE_URL") or None
+        )
+    return LocalStorage(roots, routes)
@@ -1,5 +1,22 @@
 # ppt-service/synthesis_logic.py
 
+# Field values that mean "left empty"
+_BLANK = {'n/a', 'none', 'x'}
+NOT_SPECIFIED = "Not Specified"
+
+def _bullets(text):
+    # Sentence split on newline, ';' or '. ': chained str.replace/split stays in C and beats a regex scan
+    return [s for s in map(str.strip, text.replace('\n', '. ').replace(';', '. ').split('. ')) if len(s) > 5]
+
+def clean_text(text, limit=30):
+    """
+    CLEANING PROTOCOL: collapse whitespace, enforce FIXED word limit.
+    """
+    if not text or str(text).strip().lower() in _BLANK:
+        return NOT_SPECIFIED
+    # maxsplit stops tokenizing after the limit, so long free text costs no more than short text
+    return " ".join(str(text).split(None, limit)[:limit])
+
 def polish_content(raw_input):
     """
     Takes raw team input (now slide-by-slide) and structures it 
@@ -14,8 +31,7 @@ def polish_content(raw_input):
             text = str(slide.get("content", ""))
             
             # Split text into sentences for structured representation
-            sentences = text.replace('\n', '. ').replace(';', '. ').split('. ')
-            bullets = [s.strip() for s in sentences if len(s.strip()) > 5]
+            bullets = _bullets(text)
             
             if not bullets:
                 bullets = ["Details pending team synthesis..."]
@@ -30,8 +46,7 @@ def polish_content(raw_input):
     fields = ['title', 'abstract', 'problem', 'solution', 'architecture', 'technologies', 'impact', 'outcome']
     for field in fields:
         text = str(raw_input.get(field, ""))
-        sentences = text.replace('\n', '. ').replace(';', '. ').split('. ')
-        bullets = [s.strip() for s in sentences if len(s.strip()) > 5]
+        bullets = _bullets(text)
             
         polished[field] = {
             "title": field.replace('_', ' ').title(),
@@ -0,0 +1,63 @@
+# ppt-service/tests/test_jobs.py
+"""
+Job submission paths that never reach the render pool.
+
+    python -m pytest tests                           # from the ppt-service directory
+"""
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVICE_DIR)
+
+import main
+from artifact_cache import ArtifactCache
+from artifact_index import ArtifactIndex
+from benchmarks.payloads import expert_payload
+from jobs import FAILED
+from schemas import DeckRequest
+
+BODY = {"team_name": "Cache Hit Team", "college_name": "C", "content": expert_payload("minimal")}
+
+@pytest.fixture
+def warm_cache(tmp_path, monkeypatch):
+    """
+    An artifact cache already holding the deck for BODY, so /jobs answers from it without rendering.
+    """
+    cache = ArtifactCache(str(tmp_path / "cache"))
+    data = DeckRequest(**BODY)
+    key = main.cache_key("/generate-expert-pitch", data.team_name, data.college_name, data.payload, main.GENERATOR_VERSION)
+    cache.put(key, b"PK cached deck")
+    monkeypatch.setattr(main, "artifact_cache", cache)
+    monkeypatch.setattr(main, "OUT_DIR", str(tmp_path))
+    monkeypatch.setattr(main, "artifact_index", ArtifactIndex({"outputs": str(tmp_path)}))
+    monkeypatch.setattr(main, "jobs", main.JobRegistry())
+    return cache
+
+def _post(path, body):
+    async def go():
+        # No lifespan: the render pool is never started
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://test") as client:
+            return await client.post(path, json=body)
+    return asyncio.run(go())
+
+def test_cache_hit_publish_failure_fails_the_job(warm_cache, monkeypatch):
+    def unavailable(kind, name, path):
+        raise OSError("storage unavailable")
+    monkeypatch.setattr(main.storage, "put", unavailable)
+
+    with pytest.raises(OSError):
+        _post("/jobs/expert-pitch", BODY)
+
+    (job,) = main.jobs._jobs.values()
+    assert job["status"] == FAILED
+    assert job["error"] == "storage unavailable"
+
+    # The failed job is not handed to the retry, which publishes and completes under a new id
+    monkeypatch.setattr(main.storage, "put", lambda kind, name, path: f"/outputs/{name}")
+    retry = _post("/jobs/expert-pitch", BODY).json()
+    assert retry["cached"] and retry["job_id"] != job["job_id"]
@@ -0,0 +1,18 @@
+# ppt-service/timings.py
+import time
+
+class StageTimer:
+    """
+    Splits a render into named stages. Each lap() adds the seconds since the previous lap to sink[stage];
+    with no sink it costs one perf_counter() call per lap.
+    """
+
+    def __init__(self, sink=None):
+        self.sink = sink
+        self._last = time.perf_counter()
+
+    def lap(self, stage):
+        if self.sink is None: return
+        now = time.perf_counter()
+        self.sink[stage] = self.sink.get(stage, 0.0) + (now - self._last)
+        self._last = now
@@ -0,0 +1,51 @@
+# ppt-service/warmup.py
+from io import BytesIO
+from PIL import Image
+from assets import ASSETS, load_assets
+from base_presentation import warm_bases
+from certificate_engine import create_certificate
+from expert_synthesis import create_expert_deck
+from generator import create_pptx
+from synthesis_logic import polish_content
+import os
+import time
+
+# Warm-up before the render workers fork; 0 keeps the old lazy behaviour (first request pays)
+WARMUP_ON_START = os.getenv("WARMUP_ON_START", "1") != "0"
+
+# Set once this process (or the parent it was forked from) has been warmed
+WARM = False
+
+# Small but complete inputs: every drawer runs, nothing touches the network or the output vaults
+_DECK_SAMPLE = {"slides": [{"title": "Warm Up", "content": "First point. Second point; third point"}]}
+_EXPERT_SAMPLE = {
+    "projectName": "Warm Up", "leaderName": "Lead", "memberNames": "A, B",
+    "s4_painPoints": [{"point": "Sample", "freq": "Frequent", "impact": "High"}],
+    "s9_flowSteps": ["One", "Two", "Three", "Four"],
+    "s12_competitors": [{"name": "Rival", "strength": "Reach"}],
+    "s15_allocations": [{"category": "Build", "amount": "1000"}],
+}
+
+def warm_up():
+    """
+    Pays every first-render cost up front: assets, base templates, image codecs and one dummy render
+    per engine (which also fills the compressed-part and certificate-skeleton caches).
+    Returns seconds per step.
+    """
+    global WARM
+    steps = {}
+    def step(name, fn):
+        start = time.perf_counter()
+        fn()
+        steps[name] = round(time.perf_counter() - start, 4)
+
+    step("assets", lambda: ASSETS or load_assets())
+    step("templates", warm_bases)
+    step("codecs", Image.init)
+    step("basic", lambda: create_pptx("Warm Up", "Institution", polish_content(_DECK_SAMPLE), out=BytesIO()))
+    step("expert", lambda: create_expert_deck("Warm Up", "Institution", _EXPERT_SAMPLE, out=BytesIO()))
+    step("certificate", lambda: create_certificate("Warm Up", "Institution", "I", "CSE", "Participant", out_path=BytesIO()))
+    step("certificate_template", lambda: create_certificate("Warm Up", "Institution", "I", "CSE", "Participant", out_path=BytesIO(), use_template=True))
+    WARM = True
+    print(f"[WARMUP] Ready in {sum(steps.values()):.2f}s: " + ", ".join(f"{k} {v * 1000:.0f}ms" for k, v in steps.items()))
+    return steps
@@ -0,0 +1,66 @@
+# ppt-service/zip_stream.py
+import os
+import struct
+import time
+import zlib
+
+# Read size per chunk; the only buffer an archive ever holds, whatever its total size
+ZIP_CHUNK_BYTES = int(os.getenv("ZIP_CHUNK_BYTES", 64 * 1024))
+
+_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+_DATA_DESCRIPTOR = struct.Struct("<IIII")
+_CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+_ZIP64_EXTRA = struct.Struct("<HHQ")  # header id 1, size 8, local header offset
+_ZIP64_END = struct.Struct("<IQHHIIQQQQ")
+_ZIP64_LOCATOR = struct.Struct("<IIQI")
+_END_RECORD = struct.Struct("<IHHHHIIH")
+
+_FLAGS = 0x08        # sizes and CRC follow the data (data descriptor), so every file is read exactly once
+_UTF8 = 0x800
+_MAX32 = 0xFFFFFFFF
+_MAX16 = 0xFFFF
+
+def _dos_time(ts):
+    t = time.localtime(ts)
+    return (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2), ((max(t.tm_year, 1980) - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+
+def stream_zip(members, chunk_size=ZIP_CHUNK_BYTES):
+    """
+    Yields a ZIP archive of members ((arcname, path) pairs) chunk by chunk, without temp files.
+    Entries are stored, not deflated (.pptx is already compressed), and the archive switches to ZIP64
+    records once it passes 4 GiB or 65535 entries. A member that cannot be opened raises (ending the stream)
+    rather than being left out, so the archive never silently holds fewer entries than announced; each
+    single member must stay below 4 GiB.
+    """
+    central, offset = [], 0
+    for arcname, path in members:
+        with open(path, "rb") as f:
+            name = arcname.encode("utf-8")
+            flags = _FLAGS | (_UTF8 if not arcname.isascii() else 0)
+            dos_time, dos_date = _dos_time(os.fstat(f.fileno()).st_mtime)
+            header = _LOCAL_HEADER.pack(0x04034B50, 20, flags, 0, dos_time, dos_date, 0, 0, 0, len(name), 0) + name
+            yield header
+            crc, size = 0, 0
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk: break
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+                yield chunk
+            if size > _MAX32: raise ValueError(f"{arcname} exceeds 4 GiB")
+            yield _DATA_DESCRIPTOR.pack(0x08074B50, crc, size, size)
+        # Offsets past 4 GiB move into a ZIP64 extra field of the central record
+        extra = _ZIP64_EXTRA.pack(1, 8, offset) if offset > _MAX32 else b""
+        central.append(_CENTRAL_HEADER.pack(0x02014B50, 45 if extra else 20, 45 if extra else 20, flags, 0, dos_time, dos_date,
+                                            crc, size, size, len(name), len(extra), 0, 0, 0, 0o644 << 16,
+                                            _MAX32 if extra else offset) + name + extra)
+        offset += len(header) + size + _DATA_DESCRIPTOR.size
+
+    directory = b"".join(central)
+    count, size = len(central), len(directory)
+    if count > _MAX16 or offset > _MAX32 or size > _MAX32:
+        zip64_end = _ZIP64_END.pack(0x06064B50, _ZIP64_END.size - 12, 45, 45, 0, 0, count, count, size, offset)
+        locator = _ZIP64_LOCATOR.pack(0x07064B50, 0, offset + size, 1)
+        yield directory + zip64_end + locator + _END_RECORD.pack(0x06054B50, 0, 0, _MAX16, _MAX16, _MAX32, _MAX32, 0)
+    else:
+        yield directory + _END_RECORD.pack(0x06054B50, 0, 0, count, count, size, offset, 0)